@@ -1,13 +1,19 @@
+import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
 from .path import source_path
+from .hwinfo import is_web
 
 
 class AssetManager:
     """
     Asset manager.
+
+    Image decoding starts in the background on construction, call load()
+    to wait for it and finish loading once the display is created.
     """
 
     def __init__(self):
@@ -15,33 +21,45 @@ class AssetManager:
             self.assets = json.load(f)
 
         self.__font_cache = {}
+        self.__scaled_cache = {}
+
+        # Gather every image to load as (container, key, path)
+        self.__images = []
 
         if "images" in self.assets:
             for image in self.assets["images"]:
-                surface = pygame.image.load(
-                    source_path("assets", self.assets["images"][image])
-                )
-
-                if surface.get_flags() == 0x00010000:
-                    surface = surface.convert_alpha()
-                else:
-                    surface = surface.convert()
-
-                self.assets["images"][image] = surface
+                self.__images.append((self.assets["images"], image, self.assets["images"][image]))
 
         if "animations" in self.assets:
             for animation in self.assets["animations"]:
                 for i, sprite in enumerate(self.assets["animations"][animation]):
-                    surface = pygame.image.load(
-                        source_path("assets", self.assets["animations"][animation][i])
-                    )
+                    self.__images.append((self.assets["animations"][animation], i, sprite))
+
+        paths = [source_path("assets", path) for _, _, path in self.__images]
+
+        # Decoding releases the GIL, so images are loaded in parallel while
+        # the engine keeps initializing. Threads aren't available on web.
+        if is_web():
+            self.__surfaces = [pygame.image.load(path) for path in paths]
+        else:
+            executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+            self.__surfaces = executor.map(pygame.image.load, paths)
+            executor.shutdown(wait=False)
 
-                    if surface.get_flags() == 0x00010000:
-                        surface = surface.convert_alpha()
-                    else:
-                        surface = surface.convert()
+    def load(self) -> None:
+        """ Wait for images to be decoded and finish loading assets. """
 
-                    self.assets["animations"][animation][i] = surface
+        # Conversion needs the display, do it on the main thread
+        for (container, key, _), surface in zip(self.__images, self.__surfaces):
+            if surface.get_flags() == 0x00010000:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+
+            container[key] = surface
+
+        self.__images = []
+        self.__surfaces = []
 
         if "sounds" in self.assets:
             for sound in self.assets["sounds"]:
@@ -55,4 +73,16 @@ class AssetManager:
             self.__font_cache[(name, size)] = pygame.Font(
                 source_path("assets", self.assets["fonts"][name]), size)
 
-        return self.__font_cache[(name, size)]
\ No newline at end of file
+        return self.__font_cache[(name, size)]
+
+    def get_scaled_image(self, name: str, ratio: float) -> pygame.Surface:
+        """ Get a loaded image smoothly scaled by ratio. """
+
+        # Rounded so ratios computed slightly differently share the surface
+        ratio = round(ratio, 3)
+
+        if (name, ratio) not in self.__scaled_cache:
+            self.__scaled_cache[(name, ratio)] = pygame.transform.smoothscale_by(
+                self.assets["images"][name], ratio)
+
+        return self.__scaled_cache[(name, ratio)]
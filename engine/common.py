@@ -22,6 +22,9 @@ DISPLAY_RESOLUTIONS = {
     )
 }
 
+# Same resolutions as sets for fast membership tests
+DISPLAY_RESOLUTIONS_SET = {k: frozenset(v) for k, v in DISPLAY_RESOLUTIONS.items()}
+
 # Common refresh rates of monitors
 FPS_CAPS = (
     25,
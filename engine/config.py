@@ -0,0 +1,47 @@
+from typing import Optional, Union
+
+from dataclasses import dataclass
+from pathlib import Path
+import configparser
+
+
+def _cfg_to_bool(value: str) -> bool:
+    """ Convert config entry value to bool. """
+    return value.lower() in ("true", "t", "1", "on", "yes", "y", "enabled")
+
+
+@dataclass(slots=True, frozen=True)
+class EngineConfig:
+    """
+    Engine configuration, parsed once from the settings file.
+    """
+
+    title: str
+    max_fps: float
+    master_volume: float
+    hardware_scaling: bool
+    fullscreen: bool
+    forced_width: Optional[int] = None
+    forced_height: Optional[int] = None
+    quality: int = 3
+
+    @classmethod
+    def from_ini(cls, filepath: Union[Path, str]) -> "EngineConfig":
+        """ Parse configuration from an INI file. """
+
+        parser = configparser.ConfigParser()
+        parser.read(filepath)
+
+        engine = parser["Engine"]
+        graphics = parser["Graphics"] if "Graphics" in parser else {}
+
+        return cls(
+            title=engine["title"],
+            max_fps=float(engine["max_fps"]),
+            master_volume=float(engine["master_volume"]),
+            hardware_scaling=_cfg_to_bool(engine["hardware_scaling"]),
+            fullscreen=_cfg_to_bool(engine["fullscreen"]),
+            forced_width=int(engine["forced_width"]) if "forced_width" in engine else None,
+            forced_height=int(engine["forced_height"]) if "forced_height" in engine else None,
+            quality=int(graphics["quality"]) if "quality" in graphics else 3
+        )
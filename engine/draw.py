@@ -1,17 +1,30 @@
 from typing import TYPE_CHECKING
 
-import sys
-import platform
 from functools import lru_cache
 
 import pygame
-import pymunk
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 
-@lru_cache()
+@lru_cache(maxsize=512)
+def _render_shadow_surf(font: pygame.Font, text: str) -> pygame.Surface:
+    """ Render the black shadow of text, shared between all text colors. """
+    return font.render(text, True, (0, 0, 0)).convert_alpha()
+
+
+@lru_cache(maxsize=512)
+def _render_fg_surf(
+        font: pygame.Font,
+        text: str,
+        color: tuple[float, float, float]
+        ) -> pygame.Surface:
+    """ Render the foreground of text. """
+    return font.render(text, True, color).convert_alpha()
+
+
+@lru_cache(maxsize=256)
 def render_shadow_text(
         font: pygame.Font,
         text: str,
@@ -29,7 +42,7 @@ def render_shadow_text(
     @param shadow_offset Distance of shadow from the text
     """
     
-    shadow = font.render(text, True, (0, 0, 0)).convert_alpha()
+    shadow = _render_shadow_surf(font, text)
 
     offsets = (
         (shadow_offset - shadow_offset, shadow_offset                ),
@@ -43,14 +56,20 @@ def render_shadow_text(
         pygame.SRCALPHA
     ).convert_alpha()
 
-    for p in offsets:
-        surf.blit(shadow, p)
+    surf.blits([(shadow, p) for p in offsets], doreturn=0)
 
-    surf.blit(font.render(text, True, color), (shadow_offset, shadow_offset))
+    surf.blit(_render_fg_surf(font, text, color), (shadow_offset, shadow_offset))
 
     return surf
 
 
+def clear_text_cache() -> None:
+    """ Drop all cached text surfaces. """
+    render_shadow_text.cache_clear()
+    _render_shadow_surf.cache_clear()
+    _render_fg_surf.cache_clear()
+
+
 def draw_shadow_text(
         surface: pygame.Surface,
         font: pygame.Font,
@@ -74,9 +93,10 @@ def draw_shadow_text(
     surface.blit(render_shadow_text(font, text, color, shadow_offset), pos)
 
 
-def draw_debug_ui(engine: "Engine", minimal: bool = False) -> None:
-    """ 
-    Render debug UI.
+def render_debug_ui_background(engine: "Engine", minimal: bool = False) -> pygame.Surface:
+    """
+    Render the static layer of the debug UI (background, labels and
+    hardware & version info) that doesn't change between frames.
 
     Parameters
     ----------
@@ -91,8 +111,6 @@ def draw_debug_ui(engine: "Engine", minimal: bool = False) -> None:
     row_gap = 45
     label_color = (255, 255, 255)
     avg_color = (255, 241, 115)
-    min_color = (121, 255, 94)
-    max_color = (255, 101, 87)
     cpu_color = (112, 212, 255)
     version_color = (138, 255, 208)
 
@@ -106,256 +124,208 @@ def draw_debug_ui(engine: "Engine", minimal: bool = False) -> None:
             "FPS", (5, 5 + y_gap * 0),
             label_color
         )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["fps"]["avg"])),
-            (row_start + row_gap * 0 - 30, 5 + y_gap * 0),
-            avg_color
-        )
 
-    else:
-        bg = pygame.Surface((305, 190), pygame.SRCALPHA).convert_alpha()
-        bg.fill((0, 0, 0, 130))
+        return bg
 
-        # Draw FPS stats
-        draw_shadow_text(
-            bg,
-            font,
-            "FPS", (5, 5 + y_gap * 0),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["fps"]["avg"])),
-            (row_start + row_gap * 0, 5 + y_gap * 0),
-            avg_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["fps"]["max"])),
-            (row_start + row_gap * 1, 5 + y_gap * 0),
-            min_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["fps"]["min"])),
-            (row_start + row_gap * 2, 5 + y_gap * 0),
-            max_color
-        )
+    bg = pygame.Surface((305, 190), pygame.SRCALPHA).convert_alpha()
+    bg.fill((0, 0, 0, 130))
 
-        # Draw frame time stats
-        draw_shadow_text(
-            bg,
-            font,
-            "Frame", (5, 5 + y_gap * 1),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["frame"]["avg"] * 1000, 2)),
-            (row_start + row_gap * 0, 5 + y_gap * 1),
-            avg_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["frame"]["min"] * 1000, 2)),
-            (row_start + row_gap * 1, 5 + y_gap * 1),
-            min_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["frame"]["max"] * 1000, 2)),
-            (row_start + row_gap * 2, 5 + y_gap * 1),
-            max_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            "ms",
-            (row_start + row_gap * 3, 5 + y_gap * 1),
-            label_color
-        )
+    # Stat labels
+    draw_shadow_text(
+        bg,
+        font,
+        "FPS", (5, 5 + y_gap * 0),
+        label_color
+    )
 
-        # Draw render time stats
+    for i, label in enumerate(("Frame", "Render", "Update")):
         draw_shadow_text(
             bg,
             font,
-            "Render", (5, 5 + y_gap * 2),
+            label, (5, 5 + y_gap * (i + 1)),
             label_color
         )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["render"]["avg"] * 1000, 2)),
-            (row_start + row_gap * 0, 5 + y_gap * 2),
-            avg_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["render"]["min"] * 1000, 2)),
-            (row_start + row_gap * 1, 5 + y_gap * 2),
-            min_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["render"]["max"] * 1000, 2)),
-            (row_start + row_gap * 2, 5 + y_gap * 2),
-            max_color
-        )
         draw_shadow_text(
             bg,
             font,
             "ms",
-            (row_start + row_gap * 3, 5 + y_gap * 2),
+            (row_start + row_gap * 3, 5 + y_gap * (i + 1)),
             label_color
         )
 
-        # Draw update time stats
-        draw_shadow_text(
-            bg,
-            font,
-            "Update", (5, 5 + y_gap * 3),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["update"]["avg"] * 1000, 2)),
-            (row_start + row_gap * 0, 5 + y_gap * 3),
-            avg_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["update"]["min"] * 1000, 2)),
-            (row_start + row_gap * 1, 5 + y_gap * 3),
-            min_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(round(engine.stats["update"]["max"] * 1000, 2)),
-            (row_start + row_gap * 2, 5 + y_gap * 3),
-            max_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            "ms",
-            (row_start + row_gap * 3, 5 + y_gap * 3),
-            label_color
-        )
+    # Draw hardware info
+    draw_shadow_text(
+        bg,
+        font,
+        engine.cpu_info["name"],
+        (5, 5 + y_gap * 4),
+        cpu_color
+    )
 
-        # Draw hardware info
-        draw_shadow_text(
-            bg,
-            font,
-            engine.cpu_info["name"],
-            (5, 5 + y_gap * 4),
-            cpu_color
-        )
+    draw_shadow_text(
+        bg,
+        font,
+        "Platform",
+        (5, 5 + y_gap * 5),
+        label_color
+    )
 
-        draw_shadow_text(
-            bg,
-            font,
-            "Platform",
-            (5, 5 + y_gap * 5),
-            label_color
-        )
+    draw_shadow_text(
+        bg,
+        font,
+        engine.platform,
+        (70, 5 + y_gap * 5),
+        avg_color
+    )
 
-        draw_shadow_text(
-            bg,
-            font,
-            engine.platform,
-            (70, 5 + y_gap * 5),
-            avg_color
-        )
+    # Display info
+    draw_shadow_text(
+        bg,
+        font,
+        "Display",
+        (5, 5 + y_gap * 6),
+        label_color
+    )
+    draw_shadow_text(
+        bg,
+        font,
+        f"{engine.window_width}x{engine.window_height}",
+        (60, 5 + y_gap * 6),
+        avg_color
+    )
 
-        # Display info
-        draw_shadow_text(
-            bg,
-            font,
-            "Display",
-            (5, 5 + y_gap * 6),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            f"{engine.window_width}x{engine.window_height}",
-            (60, 5 + y_gap * 6),
-            avg_color
-        )
+    # Draw version info
+    draw_shadow_text(
+        bg,
+        font,
+        "Python",
+        (5, 5 + y_gap * 7),
+        label_color
+    )
+    draw_shadow_text(
+        bg,
+        font,
+        engine.python_version,
+        (row_start - 12, 5 + y_gap * 7),
+        version_color
+    )
 
-        # Draw version info
-        is_python_64bit = sys.maxsize > 2**32
-        draw_shadow_text(
-            bg,
-            font,
-            "Python",
-            (5, 5 + y_gap * 7),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            f"{platform.python_version()}, {('32', '64')[is_python_64bit]}-bit",
-            (row_start - 12, 5 + y_gap * 7),
-            version_color
-        )
+    draw_shadow_text(
+        bg,
+        font,
+        "Pygame",
+        (5, 5 + y_gap * 8),
+        label_color
+    )
+    draw_shadow_text(
+        bg,
+        font,
+        str(engine.pygame_version),
+        (row_start - 12, 5 + y_gap * 8),
+        version_color
+    )
 
-        draw_shadow_text(
-            bg,
-            font,
-            "Pygame",
-            (5, 5 + y_gap * 8),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(engine.pygame_version),
-            (row_start - 12, 5 + y_gap * 8),
-            version_color
-        )
+    draw_shadow_text(
+        bg,
+        font,
+        "SDL",
+        (5, 5 + y_gap * 9),
+        label_color
+    )
+    draw_shadow_text(
+        bg,
+        font,
+        str(engine.sdl_version),
+        (row_start - 12, 5 + y_gap * 9),
+        version_color
+    )
 
-        draw_shadow_text(
-            bg,
-            font,
-            "SDL",
-            (5, 5 + y_gap * 9),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            str(engine.sdl_version),
-            (row_start - 12, 5 + y_gap * 9),
-            version_color
-        )
+    draw_shadow_text(
+        bg,
+        font,
+        "Pymunk",
+        (5, 5 + y_gap * 10),
+        label_color
+    )
+    draw_shadow_text(
+        bg,
+        font,
+        engine.pymunk_version,
+        (row_start - 12, 5 + y_gap * 10),
+        version_color
+    )
+
+    return bg
 
-        draw_shadow_text(
-            bg,
-            font,
-            "Pymunk",
-            (5, 5 + y_gap * 10),
-            label_color
-        )
-        draw_shadow_text(
-            bg,
-            font,
-            f"{pymunk.version} ({pymunk.chipmunk_version[:5]})",
-            (row_start - 12, 5 + y_gap * 10),
-            version_color
-        )
 
-    engine.display.blit(bg, (0, 0))
\ No newline at end of file
+def draw_debug_ui(engine: "Engine", minimal: bool = False) -> None:
+    """ 
+    Render debug UI.
+
+    Static parts are pre-rendered by render_debug_ui_background, only the
+    changing stat values are drawn here, with a single blits call.
+
+    Parameters
+    ----------
+    @param engine Engine instance.
+    @param minimal Show only FPS.
+    """
+
+    font = engine.asset_manager.get_font("FiraCode-Bold", 12)
+
+    y_gap = 16
+    row_start = 65
+    row_gap = 45
+    avg_color = (255, 241, 115)
+    min_color = (121, 255, 94)
+    max_color = (255, 101, 87)
+
+    fps = engine.stats["fps"]
+
+    if minimal:
+        blits = [
+            (engine.debug_bg_minimal, (0, 0)),
+            (
+                render_shadow_text(font, f"{fps['avg']:.0f}", avg_color),
+                (row_start + row_gap * 0 - 30, 5 + y_gap * 0)
+            )
+        ]
+
+    else:
+        blits = [
+            (engine.debug_bg_full, (0, 0)),
+
+            # FPS stats
+            (
+                render_shadow_text(font, f"{fps['avg']:.0f}", avg_color),
+                (row_start + row_gap * 0, 5 + y_gap * 0)
+            ),
+            (
+                render_shadow_text(font, f"{fps['max']:.0f}", min_color),
+                (row_start + row_gap * 1, 5 + y_gap * 0)
+            ),
+            (
+                render_shadow_text(font, f"{fps['min']:.0f}", max_color),
+                (row_start + row_gap * 2, 5 + y_gap * 0)
+            )
+        ]
+
+        # Frame, render and update time stats (profiled in nanoseconds)
+        for i, stat in enumerate(("frame", "render", "update")):
+            y = 5 + y_gap * (i + 1)
+            stat_ = engine.stats[stat]
+
+            blits.append((
+                render_shadow_text(font, f"{stat_['avg'] * 1e-6:.2f}", avg_color),
+                (row_start + row_gap * 0, y)
+            ))
+            blits.append((
+                render_shadow_text(font, f"{stat_['min'] * 1e-6:.2f}", min_color),
+                (row_start + row_gap * 1, y)
+            ))
+            blits.append((
+                render_shadow_text(font, f"{stat_['max'] * 1e-6:.2f}", max_color),
+                (row_start + row_gap * 2, y)
+            ))
+
+    engine.display.blits(blits, doreturn=0)
@@ -1,26 +1,33 @@
 from typing import Union
 
 import os; os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+import sys
+import platform
 from contextlib import contextmanager
-from time import perf_counter, time
+from collections import deque
+from bisect import bisect_right
+from time import perf_counter_ns, time
 from pathlib import Path
-import configparser
 
 import pygame
 import moderngl
+import pymunk
 
-from .common import DISPLAY_RESOLUTIONS
+from .config import EngineConfig
+from .common import DISPLAY_RESOLUTIONS, DISPLAY_RESOLUTIONS_SET
 from .input import InputManager
 from .scene import Scene
 from .hwinfo import get_cpu_info, is_web
 from .asset_manager import AssetManager
-from .draw import draw_debug_ui
+from .draw import draw_debug_ui, render_debug_ui_background, clear_text_cache
 from .gl import BasicScreenQuad
-
-
-def _cfg_to_bool(value: str) -> bool:
-    """ Convert config entry value to bool. """
-    return value.lower() in ("true", "t", "1", "on", "yes", "y", "enabled")
+from .shaders import (
+    DISPLAY_FRAGMENT_SHADER,
+    POST_FRAGMENT_SHADER,
+    POST_HOT_FRAGMENT_SHADER,
+    POST_HOT_TEMPERATURE,
+    SCALING_FRAGMENT_SHADER
+)
 
 
 EPSILON = 0.000001
@@ -28,6 +35,12 @@ EPSILON = 0.000001
 def near_enough(a: float, b: float) -> bool:
     return (a > b - EPSILON) or (a < b + EPSILON) or a == b
 
+def _res_width(resolution: tuple[int, int]) -> int:
+    return resolution[0]
+
+def _res_height(resolution: tuple[int, int]) -> int:
+    return resolution[1]
+
 
 class Engine:
     """
@@ -35,22 +48,21 @@ class Engine:
     """
 
     def __init__(self, config_path: Path) -> None:
-        self.config = configparser.ConfigParser()
-        self.config.read(config_path)
+        self.config = EngineConfig.from_ini(config_path)
 
         pygame.init()
 
         # Events & timing
         self.events = []
         self.clock = pygame.time.Clock()
-        self.max_fps = float(self.config["Engine"]["max_fps"])
+        self.max_fps = self.config.max_fps
         self.fps = self.max_fps
         self.dt = 1.0 / self.fps
         self.is_running = False
         self.frame = 0
         self.start_time = time()
 
-        self.master_volume = float(self.config["Engine"]["master_volume"])
+        self.master_volume = self.config.master_volume
 
         self.input = InputManager(self)
         #pygame.key.set_repeat(400, 40)
@@ -58,6 +70,7 @@ class Engine:
         display_info = pygame.display.Info()
         self.monitor_width = display_info.current_w
         self.monitor_height = display_info.current_h
+        self.__usable_resolutions = None
 
         # monitor scaling screws with this!
         #resolution = self.get_max_resolution(self.get_monitor_aspect_ratio())
@@ -72,26 +85,42 @@ class Engine:
         self.window_width = 1280
         self.window_height = 720
         self.__window_title = ""
-        self.window_title = self.config["Engine"]["title"]
+        self.window_title = self.config.title
 
-        self.hardware_scaling = _cfg_to_bool(self.config["Engine"]["hardware_scaling"])
+        self.hardware_scaling = self.config.hardware_scaling
         self.scaled_width = 1280
         self.scaled_height = 720
 
         if self.hardware_scaling:
-            if "forced_width" in self.config["Engine"]: self.scaled_width = int(self.config["Engine"]["forced_width"])
-            if "forced_height" in self.config["Engine"]: self.scaled_height = int(self.config["Engine"]["forced_height"])
+            if self.config.forced_width is not None: self.scaled_width = self.config.forced_width
+            if self.config.forced_height is not None: self.scaled_height = self.config.forced_height
         else:
-            if "forced_width" in self.config["Engine"]: self.window_width = int(self.config["Engine"]["forced_width"])
-            if "forced_height" in self.config["Engine"]: self.window_height = int(self.config["Engine"]["forced_height"])
+            if self.config.forced_width is not None: self.window_width = self.config.forced_width
+            if self.config.forced_height is not None: self.window_height = self.config.forced_height
 
         self.create_window()
-        if _cfg_to_bool(self.config["Engine"]["fullscreen"]): pygame.display.toggle_fullscreen()
+        if self.config.fullscreen: pygame.display.toggle_fullscreen()
+
+        # Start decoding assets now so it overlaps with shader compilation
+        self.asset_manager = AssetManager()
 
         self.context = moderngl.create_context()
         self.context.enable(moderngl.BLEND)
 
+        # Quad geometry shared by every screen quad, created on first use
+        self.screenquad_buffers = None
+
         self.display_tex = self.context.texture(self.display.get_size(), 4)
+        # Display surface is BGRX in memory, let the sampler reorder it so
+        # every shader reading the display gets RGB with an opaque alpha
+        self.display_tex.swizzle = "BGR1"
+
+        # Pixel unpack buffer the display surface is staged in before the
+        # texture upload, so the upload itself is a GPU-side copy
+        self.display_pbo = self.context.buffer(
+            reserve=self.display.get_width() * self.display.get_height() * 4,
+            dynamic=True
+        )
 
         self.final_fbo = self.context.framebuffer(
             color_attachments=self.context.texture((self.window_width, self.window_height), 4)
@@ -103,184 +132,27 @@ class Engine:
 
         self.screenquad = BasicScreenQuad(
             self,
-            vertex_shader="""
-
-#version 330
-
-in vec2 in_position;
-in vec2 in_uv;
-out vec2 v_uv;
-
-void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = in_uv;
-}
-
-            """,
-            fragment_shader="""
-
-#version 330
-
-in vec2 v_uv;
-out vec4 f_color;
-
-uniform sampler2D s_texture;
-
-void main() {
-    // pygame.Surface.get_view("1") returns an upside down and BGR texture
-    vec2 uv = v_uv;
-    uv.y = 1.0 - uv.y;
-    f_color = texture(s_texture, uv).bgra;
-}
-
-            """
+            fragment_shader=DISPLAY_FRAGMENT_SHADER
         )
 
         self.post = BasicScreenQuad(
             self,
-            vertex_shader="""
-
-#version 330
-
-in vec2 in_position;
-in vec2 in_uv;
-out vec2 v_uv;
-
-void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = in_uv;
-}
-
-            """,
-            fragment_shader="""
-#version 330
-
-// Vignette shader from: https://www.shadertoy.com/view/lsKSWR
-// 2D Simplex (slightly modified) from: https://www.shadertoy.com/view/ttcSR8
-
-in vec2 v_uv;
-out vec4 f_color;
-
-uniform float u_time;
-uniform float u_temp;
-uniform float u_fade;
-uniform sampler2D s_texture;
-
-vec3 permute(vec3 x) {
-    return mod(((x * 34.0) + 1.0) * x, 289.0);
-}
-
-float snoise(vec2 v) {
-    const vec4 C = vec4(
-        0.211324865405187, 0.366025403784439,
-        -0.577350269189626, 0.024390243902439
-    );
-
-    vec2 i = floor(v + dot(v, C.yy));
-    vec2 x0 = v - i + dot(i, C.xx);
-    vec2 i1 = (x0.x > x0.y) ? vec2(1.0, 0.0) : vec2(0.0, 1.0);
-    vec4 x12 = x0.xyxy + C.xxzz;
-    x12.xy -= i1;
-    i = mod(i, 289.0);
-    vec3 p = permute( permute( i.y + vec3(0.0, i1.y, 1.0 ))
-    + i.x + vec3(0.0, i1.x, 1.0 ));
-    vec3 m = max(0.5 - vec3(dot(x0,x0), dot(x12.xy,x12.xy), dot(x12.zw,x12.zw)), 0.0);
-    m = m*m;
-    m = m*m;
-    vec3 x = 2.0 * fract(p * C.www) - 1.0;
-    vec3 h = abs(x) - 0.5;
-    vec3 ox = floor(x + 0.5);
-    vec3 a0 = x - ox;
-    m *= 1.79284291400159 - 0.85373472095314 * (a0*a0 + h*h);
-    vec3 g;
-    g.x  = a0.x  * x0.x  + h.x  * x0.y;
-    g.yz = a0.yz * x12.xz + h.yz * x12.yw;
-    return 130.0 * dot(m, g);
-}
-
-float snoise_octaves(vec2 uv, int octaves, float alpha, float beta, vec2 gamma, float delta) {
-    vec2 pos = uv;
-    float t = 1.0;
-    float s = 1.0;
-    vec2 q = gamma;
-    float r = 0.0;
-    for (int i = 0; i < octaves; i++) {
-        r += s * snoise(pos + q);
-        pos += t * uv;
-        t *= beta;
-        s *= alpha;
-        q *= delta;
-    }
-    return r;
-}
-
-void main() {
-    vec2 uv = v_uv;
-
-    vec2 uv_vig = uv * (1.0 - uv.yx);
-    float vig = uv_vig.x * uv_vig.y * 45.0;
-    vig = pow(vig, 0.07); 
-
-    vec3 color;
-
-    if (u_temp > 0.65) {
-        float temp = (u_temp - 0.65) * 2.0;
-        float noise_factor_x = 0.0033 * temp;
-        float noise_factor_y = 0.0023 * temp;
-
-        vec2 uv_noise = uv + vec2(
-            noise_factor_x * snoise_octaves(uv * 2.0 + u_time * vec2(0.00323, 0.00345), 9,0.85, -3.0, u_time * vec2(-0.0323, -0.345), 1.203),
-            noise_factor_y * snoise_octaves(uv * 2.0 + 3.0 + u_time * vec2(-0.00323, 0.00345), 9,0.85, -3.0, u_time * vec2(-0.0323, -0.345), 1.203)
-        );
-
-        color = texture(s_texture, uv_noise).rgb;
-        color = mix(color, vec3(1.0, 0.349, 0.109), u_temp - 0.65);
-    }
-    else {
-        color = texture(s_texture, uv).rgb;
-    }
-
-    f_color = vec4(color * vig, u_fade);
-}
-
-            """
+            fragment_shader=POST_FRAGMENT_SHADER
         )
 
-        self.scaling = BasicScreenQuad(
+        self.post_hot = BasicScreenQuad(
             self,
-            vertex_shader="""
-
-#version 330
-
-in vec2 in_position;
-in vec2 in_uv;
-out vec2 v_uv;
-
-void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = in_uv;
-}
-
-            """,
-            fragment_shader="""
-
-#version 330
-
-in vec2 v_uv;
-out vec4 f_color;
-
-uniform sampler2D s_texture;
-
-void main() {
-    vec2 uv = v_uv;
-    f_color = texture(s_texture, uv);
-}
+            fragment_shader=POST_HOT_FRAGMENT_SHADER
+        )
 
-            """
+        self.scaling = BasicScreenQuad(
+            self,
+            fragment_shader=SCALING_FRAGMENT_SHADER
         )
 
         self.scenes = {}
         self.__current_scene = None
+        self.scene_has_temperature = False
 
         self.in_transition = False
         self.transitioned = False
@@ -288,24 +160,34 @@ void main() {
         self.transition_scene = ""
         self.transition_duration = 0
 
-        self.asset_manager = AssetManager()
+        self.asset_manager.load()
 
         self.pygame_version = pygame.version.ver
         self.sdl_version = ".".join((str(v) for v in pygame.get_sdl_version()))
+        self.python_version = f"{platform.python_version()}, {('32', '64')[sys.maxsize > 2**32]}-bit"
+        self.pymunk_version = f"{pymunk.version} ({pymunk.chipmunk_version[:5]})"
 
         self.cpu_info = get_cpu_info()
         self.platform = ("Desktop", "Web")[is_web()]
 
         # Profiling stuff
+        self.stat_accumulate = 30
         self.stats = {
-            "render": {"avg": 0.0, "min": 0.0, "max": 0.0, "acc": []},
-            "update": {"avg": 0.0, "min": 0.0, "max": 0.0, "acc": []},
-            "frame": {"avg": 0.0, "min": 0.0, "max": 0.0, "acc": []},
-            "fps": {"avg": 0.0, "min": 0.0, "max": 0.0, "acc": []}
+            stat: {
+                "avg": 0.0, "min": 0.0, "max": 0.0,
+                "sum": 0.0, "count": 0,
+                "acc": deque(maxlen=self.stat_accumulate),
+                # Monotonic queues of (sample index, value) for sliding min & max
+                "minq": deque(), "maxq": deque()
+            }
+            for stat in ("render", "update", "frame", "fps")
         }
-        self.stat_accumulate = 30
         self.stat_drawing = 0
 
+        # Static layers of the debug UI, only stat values are drawn per frame
+        self.debug_bg_minimal = render_debug_ui_background(self, minimal=True)
+        self.debug_bg_full = render_debug_ui_background(self, minimal=False)
+
     @property
     def window_title(self):
         return self.__window_title
@@ -326,7 +208,9 @@ void main() {
            pygame.OPENGL | pygame.DOUBLEBUF
         )
 
-        self.display = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA).convert_alpha()
+        # Display is opaque, it's cleared with a solid color every frame anyway.
+        # Explicitly 32-bit so it can be uploaded as a 4 component texture.
+        self.display = pygame.Surface((self.window_width, self.window_height), 0, 32)
 
     @property
     def aspect_ratio(self) -> float:
@@ -341,26 +225,29 @@ void main() {
 
         monitor_tuple = (self.monitor_width, self.monitor_height)
 
-        if monitor_tuple in DISPLAY_RESOLUTIONS["16:9"]:
+        if monitor_tuple in DISPLAY_RESOLUTIONS_SET["16:9"]:
             return "16:9"
         
-        elif monitor_tuple in DISPLAY_RESOLUTIONS["4:3"]:
+        elif monitor_tuple in DISPLAY_RESOLUTIONS_SET["4:3"]:
             return "4:3"
 
     def get_usable_resolutions(self) -> dict:
         """ Get usable resolutions on the monitor. """
 
-        resolutions = {"16:9": [], "4:3": []}
-
-        for res in DISPLAY_RESOLUTIONS["16:9"]:
-            if res[0] <= self.monitor_width and res[1] <= self.monitor_height:
-                resolutions["16:9"].append(res)
+        # Monitor size doesn't change, compute only once
+        if self.__usable_resolutions is None:
+            self.__usable_resolutions = {}
 
-        for res in DISPLAY_RESOLUTIONS["4:3"]:
-            if res[0] <= self.monitor_width and res[1] <= self.monitor_height:
-                resolutions["4:3"].append(res)
+            # Resolutions are sorted ascending in both dimensions, so the
+            # usable ones are a prefix and the cutoff can be bisected
+            for aspect_ratio, resolutions in DISPLAY_RESOLUTIONS.items():
+                cutoff = min(
+                    bisect_right(resolutions, self.monitor_width, key=_res_width),
+                    bisect_right(resolutions, self.monitor_height, key=_res_height)
+                )
+                self.__usable_resolutions[aspect_ratio] = resolutions[:cutoff]
 
-        return resolutions
+        return self.__usable_resolutions
     
     def get_max_resolution(self, aspect_ratio: str) -> tuple[int, int]:
         """ Get maximum usable resolution on the monitor. """
@@ -380,13 +267,19 @@ void main() {
         This function also sets the current scene as the last added one.
         """
         scene_ = scene(self)
-        self.__current_scene = scene_.__class__.__name__
-        self.scenes[self.__current_scene] = scene_
+        self.scenes[scene_.__class__.__name__] = scene_
+        self.change_scene(scene_.__class__.__name__)
+
+        # Drop text surfaces rendered for the previous scene
+        clear_text_cache()
 
     def change_scene(self, scene_name: str) -> None:
         """ Change the current scene. """
         self.__current_scene = scene_name
 
+        # Resolved once here instead of checking the scene every frame
+        self.scene_has_temperature = hasattr(self.scene, "temperature")
+
     def change_scene_transition(self, scene_name: str, duration: float) -> None:
         """ Change the current scene with a transition. """
         self.in_transition = True
@@ -400,36 +293,61 @@ void main() {
 
         self.events = pygame.event.get()
 
-        for event in self.events:
-            if event.type == pygame.QUIT:
-                self.stop()
-
+        # Input manager handles the quit event as well, in the same pass
         self.input.update()
 
     @contextmanager
     def profile(self, stat: str):
-        """ Profile code. """
+        """ Profile code. Elapsed time is accumulated in nanoseconds. """
 
-        start = perf_counter()
+        start = perf_counter_ns()
         
         try: yield None
 
         finally:
-            elapsed = perf_counter() - start
+            elapsed = perf_counter_ns() - start
             self._accumulate(stat, elapsed)
 
     def _accumulate(self, stat: str, value: float) -> None:
         """ Accumulate stat value. """
 
-        acc = self.stats[stat]["acc"]
-        acc.append(value)
+        stat_ = self.stats[stat]
+        acc = stat_["acc"]
+        minq = stat_["minq"]
+        maxq = stat_["maxq"]
+
+        n = stat_["count"]
+        stat_["count"] = n + 1
 
-        if len(acc) > self.stat_accumulate:
-            acc.pop(0)
+        # Values that can't be the window's extreme anymore are dropped
+        while minq and minq[-1][1] >= value: minq.pop()
+        minq.append((n, value))
+        while maxq and maxq[-1][1] <= value: maxq.pop()
+        maxq.append((n, value))
 
-            self.stats[stat]["avg"] = sum(acc) / len(acc)
-            self.stats[stat]["min"] = min(acc)
-            self.stats[stat]["max"] = max(acc)
+        # Drop extremes that slid out of the window
+        oldest = n + 1 - acc.maxlen
+        if minq[0][0] < oldest: minq.popleft()
+        if maxq[0][0] < oldest: maxq.popleft()
+
+        if len(acc) < acc.maxlen:
+            acc.append(value)
+            stat_["sum"] += value
+
+            if len(acc) < acc.maxlen: return
+
+        else:
+            # Deque is full, appending drops the oldest value
+            evicted = acc[0]
+            acc.append(value)
+
+            # Resum once per full turn of the ring so float error doesn't build up
+            if n % acc.maxlen == 0: stat_["sum"] = sum(acc)
+            else: stat_["sum"] += value - evicted
+
+        stat_["avg"] = stat_["sum"] / len(acc)
+        stat_["min"] = minq[0][1]
+        stat_["max"] = maxq[0][1]
 
     def stop(self) -> None:
         """ Stop the engine. """
@@ -439,65 +357,113 @@ void main() {
         """ Run the engine. """
         self.is_running = True
 
+        # Bind hot-path attributes to locals, these don't change while running
+        profile = self.profile
+        accumulate = self._accumulate
+        clock_tick = self.clock.tick
+        handle_events = self.handle_events
+        key_pressed = self.input.key_pressed
+        key_held = self.input.key_held
+        key_f1 = self.input.key_index("f1")
+        key_lshift = self.input.key_index("lshift")
+        key_escape = self.input.key_index("escape")
+        ctx_clear = self.context.clear
+        screen_use = self.context.screen.use
+        final_fbo_use = self.final_fbo.use
+        display = self.display
+        display_fill = display.fill
+        display_view = display.get_view
+        pbo_orphan = self.display_pbo.orphan
+        pbo_write = self.display_pbo.write
+        tex_write = self.display_tex.write
+        tex_use = self.display_tex.use
+        screenquad_render = self.screenquad.vao.render
+        post_shader = self.post.shader
+        post_render = self.post.vao.render
+        post_hot_shader = self.post_hot.shader
+        post_hot_render = self.post_hot.vao.render
+        final_tex_use = self.final_fbo.color_attachments[0].use
+        hardware_scaling = self.hardware_scaling
+        scaled_fbo_use = self.scaled_fbo.use
+        scaled_tex_use = self.scaled_fbo.color_attachments[0].use
+        scaling_render = self.scaling.vao.render
+        start_time = self.start_time
+        flip = pygame.display.flip
+
         while self.is_running:
-            with self.profile("frame"):
+            with profile("frame"):
 
-                self.dt = self.clock.tick(self.max_fps) * 0.001
-                self.fps = self.clock.get_fps()
-                if self.fps == float("inf"): self.fps = 0 # Prevent OverflowError for rendering
-                self._accumulate("fps", self.fps)
+                self.dt = clock_tick(self.max_fps) * 0.001
+                # Instantaneous FPS, it's averaged by the stats anyway
+                self.fps = 1.0 / self.dt if self.dt > 0.0 else 0.0
+                accumulate("fps", self.fps)
 
-                self.handle_events()
+                handle_events()
 
-                if self.input.key_pressed("f1"):
+                if key_pressed(key_f1):
                     self.stat_drawing = (self.stat_drawing + 1) % 3
 
-                if self.input.key_held("lshift") and self.input.key_pressed("escape"):
+                if key_held(key_lshift) and key_pressed(key_escape):
                     self.stop()
 
-                with self.profile("update"):
-                    for entity in self.scene.entities:
-                        entity.update()
+                with profile("update"):
+                    scene = self.scene
+
+                    # Entities killed earlier in this loop are skipped
+                    for entity in scene.entities:
+                        if entity.alive and entity.has_update: entity.update()
+
+                    scene.update()
 
-                    self.scene.update()
+                    # Pruned here too, the scene might be left before it renders
+                    scene.prune_entities()
 
-                with self.profile("render"):
-                    self.context.screen.use()
-                    self.context.clear(0, 0, 0)
-                    self.final_fbo.use()
-                    self.context.clear(0, 0, 0)
-                    self.display.fill((14, 12, 28))
+                with profile("render"):
+                    # Scene might've been changed while updating
+                    scene = self.scene
 
-                    self.scene.render_before()
+                    screen_use()
+                    ctx_clear(0, 0, 0)
+                    # No need to clear final FBO, the opaque display quad covers all of it
+                    final_fbo_use()
+                    display_fill((14, 12, 28))
 
-                    entities = sorted(self.scene.entities, key=lambda e: e.z_index, reverse=False)
+                    scene.render_before()
 
-                    for entity in entities:
-                        entity.render_before()
+                    scene.prune_entities()
+                    scene.sort_entities()
+
+                    for entity in scene.entities:
+                        if entity.has_render_before: entity.render_before()
                         
                         if entity.sprite is not None:
                             entity.sprite.render(
-                                self.display,
+                                display,
                                 entity.position
                             )
 
-                        entity.render_after()
+                        if entity.has_render_after: entity.render_after()
+
+                    scene.render_after()
 
-                    self.scene.render_after()
+                    # 0: hidden, 1: minimal, 2: full
+                    if self.stat_drawing:
+                        draw_debug_ui(self, self.stat_drawing == 1)
 
-                    if self.stat_drawing in (1, 2):
-                        # Ugly way to convert (1, 2) to (True, False)
-                        draw_debug_ui(self, 1 - (self.stat_drawing - 1))
+                    # Orphan first so the write doesn't wait on last frame's upload
+                    pbo_orphan()
+                    pbo_write(display_view("1"))
+                    tex_write(self.display_pbo)
+                    tex_use(0)
+                    screenquad_render()
 
-                    self.display_tex.write(self.display.get_view("1"))
-                    self.display_tex.use(0)
-                    self.screenquad.vao.render()
+                    scene.render_post()
 
-                    self.scene.render_post()
+                    now = time()
 
                     fade = 1.0
                     if self.in_transition:
-                        t = (time() - self.transition_start) / self.transition_duration
+                        t = (now - self.transition_start) / self.transition_duration
 
                         if not self.transitioned and t >= 0.5:
                             self.transitioned = True
@@ -511,22 +477,29 @@ void main() {
                         else:
                             fade = (1.0 - t) * 2.0 - 1.0
 
-                    if self.hardware_scaling: self.scaled_fbo.use()
-                    else: self.context.screen.use()
-                    self.final_fbo.color_attachments[0].use(0)
-                    self.post.shader["u_time"] = time() - self.start_time
-                    self.post.shader["u_fade"] = fade
-                    if hasattr(self.scene, "temperature"):
-                        self.post.shader["u_temp"] = self.scene.temperature / 100.0
+                    if hardware_scaling: scaled_fbo_use()
+                    else: screen_use()
+                    final_tex_use(0)
+                    if self.scene_has_temperature:
+                        temp = self.scene.temperature * 0.01
+                    else:
+                        temp = 25.0 / 100.0
+
+                    # Only the hot variant uses time and temperature uniforms
+                    if temp > POST_HOT_TEMPERATURE:
+                        post_hot_shader["u_time"] = now - start_time
+                        post_hot_shader["u_temp"] = temp
+                        post_hot_shader["u_fade"] = fade
+                        post_hot_render()
                     else:
-                        self.post.shader["u_temp"] = 25.0 / 100.0
-                    self.post.vao.render()
+                        post_shader["u_fade"] = fade
+                        post_render()
 
-                    if self.hardware_scaling:
-                        self.context.screen.use()
-                        self.scaled_fbo.color_attachments[0].use(0)
-                        self.scaling.vao.render()
+                    if hardware_scaling:
+                        screen_use()
+                        scaled_tex_use(0)
+                        scaling_render()
 
-                    pygame.display.flip()
+                    flip()
 
         pygame.quit()
\ No newline at end of file
@@ -12,6 +12,18 @@ class Entity:
     Base class for all game objects in a scene.
     """
 
+    # Whether the class overrides the update and render callbacks, so the
+    # engine can skip calling the empty base ones
+    has_update = False
+    has_render_before = False
+    has_render_after = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.has_update = cls.update is not Entity.update
+        cls.has_render_before = cls.render_before is not Entity.render_before
+        cls.has_render_after = cls.render_after is not Entity.render_after
+
     def __init__(self,
             scene: "Scene",
             position: pygame.Vector2 | tuple[float, float],
@@ -19,15 +31,27 @@ class Entity:
             ):
         self.scene = scene
         self.engine = scene.engine
+        self.alive = True
+        self.__z_index = 1
         self.scene.add_entity(self)
 
         self.position = pygame.Vector2(position)
         self.sprite = sprite
-        self.z_index = 1
+
+    @property
+    def z_index(self) -> int:
+        return self.__z_index
+
+    @z_index.setter
+    def z_index(self, value: int):
+        if value != self.__z_index:
+            self.__z_index = value
+            self.scene.invalidate_z_order()
 
     def kill(self):
         """ Remove the entity from the scene. """
-        self.scene.entities.remove(self)
+        self.alive = False
+        self.scene.remove_entity(self)
 
     def update(self):
         """ Entity update callback. """
@@ -2,21 +2,19 @@ from typing import TYPE_CHECKING
 
 import array
 
+import moderngl
+
+from .shaders import SCREENQUAD_VERTEX_SHADER
+
 if TYPE_CHECKING:
     from .engine import Engine
 
 
-class BasicScreenQuad:
-    def __init__(
-            self,
-            engine: "Engine",
-            vertex_shader: str,
-            fragment_shader: str
-            ) -> None:
-        self.engine = engine
-        self.shader = self.engine.context.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)
+def get_screenquad_buffers(engine: "Engine") -> tuple[moderngl.Buffer, moderngl.Buffer, moderngl.Buffer]:
+    """ Get the vertex, index and UV buffers shared by all screen quads. """
 
-        self.vbo = self.engine.context.buffer(
+    if engine.screenquad_buffers is None:
+        vbo = engine.context.buffer(
             array.array("f", [
                 1.0,  1.0,
                 1.0, -1.0,
@@ -25,24 +23,43 @@ class BasicScreenQuad:
             ])
         )
 
-        self.ibo = self.engine.context.buffer(
-            array.array("i", [
+        # Only 4 vertices, 16-bit indices are enough
+        ibo = engine.context.buffer(
+            array.array("H", [
                 0, 1, 3,
                 1, 2, 3
             ])
         )
 
-        self.uvbo = self.engine.context.buffer(
+        uvbo = engine.context.buffer(
             array.array("f", [
                 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0
             ])
         )
 
+        engine.screenquad_buffers = (vbo, ibo, uvbo)
+
+    return engine.screenquad_buffers
+
+
+class BasicScreenQuad:
+    def __init__(
+            self,
+            engine: "Engine",
+            fragment_shader: str,
+            vertex_shader: str = SCREENQUAD_VERTEX_SHADER
+            ) -> None:
+        self.engine = engine
+        self.shader = self.engine.context.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)
+
+        self.vbo, self.ibo, self.uvbo = get_screenquad_buffers(self.engine)
+
         self.vao = self.engine.context.vertex_array(
             self.shader,
             (
                 self.vbo.bind("in_position", layout="2f"),
                 self.uvbo.bind("in_uv", layout="2f")
             ),
-            index_buffer=self.ibo
+            index_buffer=self.ibo,
+            index_element_size=2
         )
\ No newline at end of file
@@ -1,7 +1,7 @@
 import sys
 import platform
-import subprocess
 import multiprocessing
+from functools import lru_cache
 
 
 def is_web() -> bool:
@@ -9,6 +9,7 @@ def is_web() -> bool:
     return sys.platform.lower() == "emscripten"
 
 
+@lru_cache(maxsize=None)
 def get_cpu_info() -> dict:
     """
     Gather CPU information.
@@ -31,11 +32,17 @@ def get_cpu_info() -> dict:
 
     name = ""
 
-    # Try wmic command on Windows
+    # Read the processor name from registry on Windows
     if platform.system() == "Windows":
         try:
-            out = subprocess.check_output("wmic cpu get name", shell=True)
-            name = out.decode("utf-8").strip().split("\n")[1]
+            import winreg
+
+            key = winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0"
+            )
+            name = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+            winreg.CloseKey(key)
 
         except:
             name = def_name
@@ -43,13 +50,11 @@ def get_cpu_info() -> dict:
     # Try parsing /proc/cpuinfo on Linux
     elif platform.system() == "Linux":
         try:
-            out = subprocess.check_output("cat /proc/cpuinfo", shell=True)
-            lines = out.decode("utf-8").strip().split("\n")
-
-            for line in lines:
-                if line.startswith("model name"):
-                    name = line.split(":")[1]
-                    break
+            with open("/proc/cpuinfo", "r") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        name = line.split(":")[1].rstrip("\n")
+                        break
 
             # /proc/cpuinfo doesn't have model name field
             if name == "": name = def_name
@@ -1,6 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
+
+from functools import lru_cache
 
 import pygame
+from pygame import KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL, QUIT
 
 if TYPE_CHECKING:
     from .engine import Engine
@@ -14,9 +17,16 @@ class InputManager:
     def __init__(self, engine: "Engine"):
         self.engine = engine
 
-        #                          held pressed released
-        self.__key_states = {k:   [0,   0,      0       ] for k in KEY_MAPPING}
-        self.__mouse_states = {b: [0,   0,      0       ] for b in MOUSE_MAPPING}
+        # Key and mouse button states, indexed by _KEY_INDEX & _MOUSE_INDEX
+        self.__key_held = bytearray(len(KEY_MAPPING))
+        self.__key_pressed = bytearray(len(KEY_MAPPING))
+        self.__key_released = bytearray(len(KEY_MAPPING))
+        self.__key_zeros = bytes(len(KEY_MAPPING))
+
+        self.__mouse_held = bytearray(len(MOUSE_MAPPING))
+        self.__mouse_pressed = bytearray(len(MOUSE_MAPPING))
+        self.__mouse_released = bytearray(len(MOUSE_MAPPING))
+        self.__mouse_zeros = bytes(len(MOUSE_MAPPING))
 
         self.mouse = pygame.Vector2(0)
         self.mouse_rel = pygame.Vector2(0)
@@ -28,78 +38,117 @@ class InputManager:
     def update(self):
         """ Update input states. """
 
-        self.mouse = pygame.Vector2(*pygame.mouse.get_pos())
-        self.mouse_rel = pygame.Vector2(*pygame.mouse.get_rel())
+        # Update in place instead of allocating new vectors every frame
+        self.mouse.update(pygame.mouse.get_pos())
+        self.mouse_rel.update(pygame.mouse.get_rel())
 
         if self.engine.hardware_scaling:
             self.mouse /= self.engine.scaled_width / 1280
 
         # Reset pressed and released states
-        for k in self.__key_states:
-            self.__key_states[k][1] = 0
-            self.__key_states[k][2] = 0
+        key_held = self.__key_held
+        key_pressed = self.__key_pressed
+        key_released = self.__key_released
+        key_pressed[:] = self.__key_zeros
+        key_released[:] = self.__key_zeros
 
-        for b in self.__mouse_states:
-            self.__mouse_states[b][1] = 0
-            self.__mouse_states[b][2] = 0
+        mouse_held = self.__mouse_held
+        mouse_pressed = self.__mouse_pressed
+        mouse_released = self.__mouse_released
+        mouse_pressed[:] = self.__mouse_zeros
+        mouse_released[:] = self.__mouse_zeros
 
-        for event in self.engine.events:
-            if event.type == pygame.KEYDOWN:
-                self.__key_states[_KEY_INVDICT[event.key]][0] = 1
-                self.__key_states[_KEY_INVDICT[event.key]][1] = 1
+        key_index = _KEY_CODE_INDEX.get
+        mouse_index = _MOUSE_BUTTON_INDEX.get
 
-            elif event.type == pygame.KEYUP:
-                self.__key_states[_KEY_INVDICT[event.key]][0] = 0
-                self.__key_states[_KEY_INVDICT[event.key]][1] = 0
-                self.__key_states[_KEY_INVDICT[event.key]][2] = 1
+        for event in self.engine.events:
+            type_ = event.type
+
+            if type_ == KEYDOWN:
+                i = key_index(event.key)
+                if i is not None:
+                    key_held[i] = 1
+                    key_pressed[i] = 1
+
+            elif type_ == KEYUP:
+                i = key_index(event.key)
+                if i is not None:
+                    key_held[i] = 0
+                    key_pressed[i] = 0
+                    key_released[i] = 1
+
+            elif type_ == MOUSEBUTTONDOWN:
+                i = mouse_index(event.button)
+                if i is not None:
+                    mouse_held[i] = 1
+                    mouse_pressed[i] = 1
+
+            elif type_ == MOUSEBUTTONUP:
+                i = mouse_index(event.button)
+                if i is not None:
+                    mouse_held[i] = 0
+                    mouse_pressed[i] = 0
+                    mouse_released[i] = 1
+
+            elif type_ == MOUSEWHEEL:
+                if event.y > 0:
+                    mouse_pressed[_WHEELUP] = 1
 
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.__mouse_states[_MOUSE_INVDICT[event.button]][0] = 1
-                self.__mouse_states[_MOUSE_INVDICT[event.button]][1] = 1
+                elif event.y < 0:
+                    mouse_pressed[_WHEELDOWN] = 1
 
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self.__mouse_states[_MOUSE_INVDICT[event.button]][0] = 0
-                self.__mouse_states[_MOUSE_INVDICT[event.button]][1] = 0
-                self.__mouse_states[_MOUSE_INVDICT[event.button]][2] = 1
+            elif type_ == QUIT:
+                self.engine.stop()
 
-            elif event.type == pygame.MOUSEWHEEL:
-                if event.y > 0:
-                    self.__mouse_states["wheelup"][1] = 1
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def key_index(key: str) -> int:
+        """ Resolve key name to its state index, to be used in key queries. """
+        return _KEY_INDEX[key.lower()]
 
-                elif event.y < 0:
-                    self.__mouse_states["wheeldown"][1] = 1
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def mouse_index(button: str) -> int:
+        """ Resolve mouse button name to its state index, to be used in mouse queries. """
+        return _MOUSE_INDEX[button.lower()]
 
-    def key_pressed(self, key: str) -> bool:
+    def key_pressed(self, key: Union[str, int]) -> bool:
         """ Check if key is just pressed. """
-        return self.__key_states[key.lower()][1]
+        if isinstance(key, str): key = self.key_index(key)
+        return self.__key_pressed[key]
 
-    def key_released(self, key: str) -> bool:
+    def key_released(self, key: Union[str, int]) -> bool:
         """ Check if key is just released. """
-        return self.__key_states[key.lower()][2]
+        if isinstance(key, str): key = self.key_index(key)
+        return self.__key_released[key]
 
-    def key_held(self, key: str) -> bool:
+    def key_held(self, key: Union[str, int]) -> bool:
         """ Check if key is currently pressed. """
-        return self.__key_states[key.lower()][0]
+        if isinstance(key, str): key = self.key_index(key)
+        return self.__key_held[key]
 
-    def mouse_pressed(self, button: str) -> bool:
+    def mouse_pressed(self, button: Union[str, int]) -> bool:
         """ Check if mouse button is just pressed. """
-        return self.__mouse_states[button.lower()][1]
+        if isinstance(button, str): button = self.mouse_index(button)
+        return self.__mouse_pressed[button]
 
-    def mouse_released(self, button: str) -> bool:
+    def mouse_released(self, button: Union[str, int]) -> bool:
         """ Check if mouse button is just released. """
-        return self.__mouse_states[button.lower()][2]
+        if isinstance(button, str): button = self.mouse_index(button)
+        return self.__mouse_released[button]
 
-    def mouse_held(self, button: str) -> bool:
+    def mouse_held(self, button: Union[str, int]) -> bool:
         """ Check if mouse button is currently pressed. """
-        return self.__mouse_states[button.lower()][0]
+        if isinstance(button, str): button = self.mouse_index(button)
+        return self.__mouse_held[button]
 
     def mouse_wheel_up(self) -> bool:
         """ Check if mouse wheel rotated upwards. """
-        return self.__mouse_states["wheelup"][1]
+        return self.__mouse_pressed[_WHEELUP]
 
     def mouse_wheel_down(self) -> bool:
         """ Check if mouse wheel is rotated downwards. """
-        return self.__mouse_states["wheeldown"][1]
+        return self.__mouse_pressed[_WHEELDOWN]
     
     def get_stick(self, index: int = 0, device: int = 0) -> pygame.Vector2:
         """ Return the normalized stick axis at given index. """
@@ -279,6 +328,13 @@ MOUSE_MAPPING= {
     "extra6": 11
 }
 
-# Inverted mappings used by input manager
-_KEY_INVDICT = {v: k for k, v in KEY_MAPPING.items()}
-_MOUSE_INVDICT = {v: k for k, v in MOUSE_MAPPING.items()}
\ No newline at end of file
+# Key and button names to state array indices used by input manager
+_KEY_INDEX = {k: i for i, k in enumerate(KEY_MAPPING)}
+_MOUSE_INDEX = {b: i for i, b in enumerate(MOUSE_MAPPING)}
+
+# Pygame key constants and button events to state array indices
+_KEY_CODE_INDEX = {v: _KEY_INDEX[k] for k, v in KEY_MAPPING.items()}
+_MOUSE_BUTTON_INDEX = {v: _MOUSE_INDEX[b] for b, v in MOUSE_MAPPING.items()}
+
+_WHEELUP = _MOUSE_INDEX["wheelup"]
+_WHEELDOWN = _MOUSE_INDEX["wheeldown"]
\ No newline at end of file
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+from bisect import insort
+
 import pygame
 
 if TYPE_CHECKING:
@@ -7,6 +9,10 @@ if TYPE_CHECKING:
     from .entity import Entity
     
 
+def _z_index_key(entity: "Entity") -> int:
+    return entity.z_index
+
+
 class Scene:
     """
     Base scene class.
@@ -18,11 +24,37 @@ class Scene:
         # Active camera
         self.camera = pygame.Vector2(0)
 
+        # Entities are kept sorted by their z-index
         self.entities = []
+        self.z_order_dirty = False
+        self.prune_pending = False
 
     def add_entity(self, entity: "Entity"):
         """ Add entity to the scene. """
-        self.entities.append(entity)
+        if self.z_order_dirty:
+            self.entities.append(entity)
+        else:
+            insort(self.entities, entity, key=_z_index_key)
+
+    def remove_entity(self, entity: "Entity"):
+        """ Remove entity from the scene, it's dropped from the list on the next prune. """
+        self.prune_pending = True
+
+    def prune_entities(self):
+        """ Drop removed entities from the list in one pass. """
+        if self.prune_pending:
+            self.entities = [entity for entity in self.entities if entity.alive]
+            self.prune_pending = False
+
+    def invalidate_z_order(self):
+        """ Mark entities to be re-sorted, called when an entity's z-index changes. """
+        self.z_order_dirty = True
+
+    def sort_entities(self):
+        """ Sort entities by z-index if the order is invalidated. """
+        if self.z_order_dirty:
+            self.entities.sort(key=_z_index_key)
+            self.z_order_dirty = False
 
     def update(self):
         """ Scene update callback. """
@@ -0,0 +1,147 @@
+# Shader sources used by the engine's screen quads
+
+# Shared by every screen quad that doesn't need its own vertex stage
+SCREENQUAD_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_position;
+in vec2 in_uv;
+out vec2 v_uv;
+
+void main() {
+    gl_Position = vec4(in_position, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+# Draws the uploaded display surface
+DISPLAY_FRAGMENT_SHADER = """
+#version 330
+
+in vec2 v_uv;
+out vec4 f_color;
+
+uniform sampler2D s_texture;
+
+void main() {
+    // pygame.Surface.get_view("1") returns an upside down texture
+    // BGR order and the padding alpha byte are handled by texture swizzle
+    vec2 uv = v_uv;
+    uv.y = 1.0 - uv.y;
+    f_color = texture(s_texture, uv);
+}
+"""
+
+# Vignette, heat haze and fade post-process
+POST_FRAGMENT_SHADER = """
+#version 330
+
+// Vignette shader from: https://www.shadertoy.com/view/lsKSWR
+// 2D Simplex (slightly modified) from: https://www.shadertoy.com/view/ttcSR8
+
+in vec2 v_uv;
+out vec4 f_color;
+
+uniform float u_time;
+uniform float u_temp;
+uniform float u_fade;
+uniform sampler2D s_texture;
+
+vec3 permute(vec3 x) {
+    return mod(((x * 34.0) + 1.0) * x, 289.0);
+}
+
+float snoise(vec2 v) {
+    const vec4 C = vec4(
+        0.211324865405187, 0.366025403784439,
+        -0.577350269189626, 0.024390243902439
+    );
+
+    vec2 i = floor(v + dot(v, C.yy));
+    vec2 x0 = v - i + dot(i, C.xx);
+    vec2 i1 = (x0.x > x0.y) ? vec2(1.0, 0.0) : vec2(0.0, 1.0);
+    vec4 x12 = x0.xyxy + C.xxzz;
+    x12.xy -= i1;
+    i = mod(i, 289.0);
+    vec3 p = permute( permute( i.y + vec3(0.0, i1.y, 1.0 ))
+    + i.x + vec3(0.0, i1.x, 1.0 ));
+    vec3 m = max(0.5 - vec3(dot(x0,x0), dot(x12.xy,x12.xy), dot(x12.zw,x12.zw)), 0.0);
+    m = m*m;
+    m = m*m;
+    vec3 x = 2.0 * fract(p * C.www) - 1.0;
+    vec3 h = abs(x) - 0.5;
+    vec3 ox = floor(x + 0.5);
+    vec3 a0 = x - ox;
+    m *= 1.79284291400159 - 0.85373472095314 * (a0*a0 + h*h);
+    vec3 g;
+    g.x  = a0.x  * x0.x  + h.x  * x0.y;
+    g.yz = a0.yz * x12.xz + h.yz * x12.yw;
+    return 130.0 * dot(m, g);
+}
+
+float snoise_octaves(vec2 uv, int octaves, float alpha, float beta, vec2 gamma, float delta) {
+    vec2 pos = uv;
+    float t = 1.0;
+    float s = 1.0;
+    vec2 q = gamma;
+    float r = 0.0;
+    for (int i = 0; i < octaves; i++) {
+        r += s * snoise(pos + q);
+        pos += t * uv;
+        t *= beta;
+        s *= alpha;
+        q *= delta;
+    }
+    return r;
+}
+
+void main() {
+    vec2 uv = v_uv;
+
+    vec2 uv_vig = uv * (1.0 - uv.yx);
+    float vig = uv_vig.x * uv_vig.y * 45.0;
+    vig = pow(vig, 0.07); 
+
+    vec3 color;
+
+    // Heat haze variant is compiled separately with HOT defined
+#ifdef HOT
+    {
+        float temp = (u_temp - 0.65) * 2.0;
+        float noise_factor_x = 0.0033 * temp;
+        float noise_factor_y = 0.0023 * temp;
+
+        vec2 uv_noise = uv + vec2(
+            noise_factor_x * snoise_octaves(uv * 2.0 + u_time * vec2(0.00323, 0.00345), 9,0.85, -3.0, u_time * vec2(-0.0323, -0.345), 1.203),
+            noise_factor_y * snoise_octaves(uv * 2.0 + 3.0 + u_time * vec2(-0.00323, 0.00345), 9,0.85, -3.0, u_time * vec2(-0.0323, -0.345), 1.203)
+        );
+
+        color = texture(s_texture, uv_noise).rgb;
+        color = mix(color, vec3(1.0, 0.349, 0.109), u_temp - 0.65);
+    }
+#else
+    color = texture(s_texture, uv).rgb;
+#endif
+
+    f_color = vec4(color * vig, u_fade);
+}
+"""
+
+# Post-process variant with heat haze, used above POST_HOT_TEMPERATURE
+POST_HOT_FRAGMENT_SHADER = POST_FRAGMENT_SHADER.replace("#version 330\n", "#version 330\n#define HOT\n", 1)
+POST_HOT_TEMPERATURE = 0.65
+
+# Draws the final frame to the scaled window
+SCALING_FRAGMENT_SHADER = """
+#version 330
+
+in vec2 v_uv;
+out vec4 f_color;
+
+uniform sampler2D s_texture;
+
+void main() {
+    vec2 uv = v_uv;
+    f_color = texture(s_texture, uv);
+}
+"""
\ No newline at end of file
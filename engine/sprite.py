@@ -1,11 +1,19 @@
 from typing import TYPE_CHECKING
 
+from functools import lru_cache
+
 import pygame
 
 if TYPE_CHECKING:
     from .engine import Engine
 
 
+@lru_cache(maxsize=512)
+def _transform_surface(surface: pygame.Surface, angle: float, scale: float) -> pygame.Surface:
+    """ Scale and rotate a surface, shared by all sprites using the same frame. """
+    return pygame.transform.rotate(pygame.transform.scale_by(surface, scale), angle)
+
+
 class Sprite:
     """
     Class representing graphics of entities on screen.
@@ -17,26 +25,33 @@ class Sprite:
         self.asset = asset
 
         self.has_animation = self.asset in engine.asset_manager.assets["animations"]
-        self.frames = len(engine.asset_manager.assets["animations"][self.asset])
+        if self.has_animation:
+            self.__animation_frames = engine.asset_manager.assets["animations"][self.asset]
+        else:
+            self.__animation_frames = ()
+        self.frames = len(self.__animation_frames)
         self.frame = 0
         self.duration = 250
         self.is_playing = False
         self.is_looped = False
         self.reverse_loop = False
-        self.__loop_turn = False
+        self.__direction = 1
         self.__last_frame = pygame.time.get_ticks()
 
         if self.has_animation:
-            self.og_surface = engine.asset_manager.assets["animations"][asset][0]
+            self.og_surface = self.__animation_frames[0]
         else:
             self.og_surface = engine.asset_manager.assets["sprites"][asset]
-        self.surface = self.og_surface.copy()
+        # Only blitted, render_self replaces it with the transformed surface
+        self.surface = self.og_surface
 
         self.__angle = 0
         self.__scale = 1
-        self.__scaled_surface = None
-        self.__is_rotated = False
-        self.__is_scaled = False
+        self.__is_transformed = False
+
+        # Every animation frame transformed with the current angle and scale
+        self.__baked_frames = []
+        self.__baked_key = None
 
     @property
     def angle(self):
@@ -45,7 +60,7 @@ class Sprite:
     @angle.setter
     def angle(self, value: float):
         self.__angle = value
-        self.__is_rotated = False
+        self.__is_transformed = False
 
     @property
     def scale(self):
@@ -54,7 +69,7 @@ class Sprite:
     @scale.setter
     def scale(self, value: float):
         self.__scale = value
-        self.__is_scaled = False
+        self.__is_transformed = False
 
     def play(self, loop: bool = False, reverse_loop: bool = False):
         """ Start playing sprite animation. """
@@ -71,46 +86,57 @@ class Sprite:
     def render_self(self, force: bool = False):
         """ Update the sprite surface. """
 
-        if force:
-            self.__is_scaled = False
-            self.__is_rotated = False
+        if force or not self.__is_transformed:
+            # Quantized so close angles and scales hit the same cached surface
+            key = (round(self.__angle), round(self.__scale, 2))
+
+            if self.has_animation:
+                # Transform all frames at once when angle or scale changes,
+                # advancing the animation then only indexes the baked frames
+                if key != self.__baked_key:
+                    self.__baked_frames = [
+                        _transform_surface(frame, *key)
+                        for frame in self.__animation_frames
+                    ]
+                    self.__baked_key = key
 
-        if not self.__is_scaled:
-            self.__scaled_surface = pygame.transform.scale_by(self.og_surface, self.__scale)
-            self.__is_scaled = True
+                self.surface = self.__baked_frames[self.frame]
 
-        if not self.__is_rotated:
-            self.surface = pygame.transform.rotate(self.__scaled_surface, self.__angle)
-            self.__is_rotated = True
+            else:
+                self.surface = _transform_surface(self.og_surface, *key)
+
+            self.__is_transformed = True
 
     def render(self, surface: pygame.Surface, position: pygame.Vector2):
 
-        if self.has_animation and self.is_playing and pygame.time.get_ticks() - self.__last_frame > self.duration:
-            if self.__loop_turn: self.frame -= 1
-            else: self.frame += 1
+        now = pygame.time.get_ticks()
+
+        if self.has_animation and self.is_playing and now - self.__last_frame > self.duration:
+            # Direction is +1 normally and -1 on the way back of a reverse loop
+            frame = self.frame + self.__direction
 
-            if self.frame == self.frames:
+            if frame == self.frames:
                 if self.reverse_loop and self.is_looped:
-                    self.__loop_turn = not self.__loop_turn
-                    self.frame -= 2
+                    self.__direction = -1
+                    frame -= 2
 
                 elif self.is_looped:
-                    self.frame = 0
+                    frame = 0
 
                 else:
-                    self.frame -= 1
+                    frame -= 1
                     self.stop()
 
-            elif self.frame == -1 and self.reverse_loop:
-                self.__loop_turn = not self.__loop_turn
-                self.frame += 2
+            elif frame == -1 and self.reverse_loop:
+                self.__direction = 1
+                frame += 2
 
-            self.og_surface = self.engine.asset_manager.assets["animations"][self.asset][self.frame]
-            self.surface = self.og_surface.copy()
-            self.__last_frame = pygame.time.get_ticks()
+            self.frame = frame
+            self.og_surface = self.__animation_frames[frame]
+            self.__last_frame = now
             self.render_self(force=True)
 
         else:
             self.render_self()
 
-        surface.blit(self.surface, self.surface.get_rect(center=position))
\ No newline at end of file
+        surface.blit(self.surface, self.surface.get_rect(center=position))
@@ -15,13 +15,18 @@ class Button(Entity):
             position: pygame.Vector2,
             size: tuple[float, float]
         ) -> None:
-        super().__init__(scene, position)
-        self.size = size
+        # Whole pixels, so blits and hit tests don't deal with fractions
+        super().__init__(scene, pygame.Vector2(int(position.x), int(position.y)))
+        self.size = (int(size[0]), int(size[1]))
         self.pressed = False
         self.hovered = False
 
     def update(self) -> None:
-        if pygame.Rect((self.position.x, self.position.y, self.size[0], self.size[1])).collidepoint(self.engine.input.mouse):
+        mx, my = self.engine.input.mouse
+        x, y = self.position
+        w, h = self.size
+
+        if x <= mx < x + w and y <= my < y + h:
             if not self.hovered:
                 self.hovered_event()
                 self.hovered = True
@@ -59,25 +64,29 @@ class MenuButton(Button):
 
         self.window_ratio = self.engine.window_width / 1920
 
-        self.open_surf = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"button_{self.type}_open"], self.window_ratio)
-        self.close_surf = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"button_{self.type}_close"], self.window_ratio)
-        self.hand_surf = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"menu_hand"], self.window_ratio)
+        self.open_surf = self.engine.asset_manager.get_scaled_image(f"button_{self.type}_open", self.window_ratio)
+        self.close_surf = self.engine.asset_manager.get_scaled_image(f"button_{self.type}_close", self.window_ratio)
+        self.hand_surf = self.engine.asset_manager.get_scaled_image(f"menu_hand", self.window_ratio)
+        offset = 240 if self.type == "settings" else 200
+        self.hand_pos = (int(self.position.x - offset * self.window_ratio), int(self.position.y))
+
+        self.hover_sound = self.engine.asset_manager.assets["sounds"]["ui1"]
+        self.click_sound = self.engine.asset_manager.assets["sounds"]["ui4"]
 
     def render_before(self) -> None:
         surf = self.close_surf if self.pressed else self.open_surf
         self.engine.display.blit(surf, self.position)
 
         if self.hovered:
-            offset = 240 if self.type == "settings" else 200
-            self.engine.display.blit(self.hand_surf, (self.position.x - offset * self.window_ratio, self.position.y))
+            self.engine.display.blit(self.hand_surf, self.hand_pos)
 
     def hovered_event(self) -> None:
-        self.engine.asset_manager.assets["sounds"]["ui1"].set_volume(self.engine.master_volume)
-        self.engine.asset_manager.assets["sounds"]["ui1"].play()
+        self.hover_sound.set_volume(self.engine.master_volume)
+        self.hover_sound.play()
 
     def clicked_event(self) -> None:
-        self.engine.asset_manager.assets["sounds"]["ui4"].set_volume(self.engine.master_volume)
-        self.engine.asset_manager.assets["sounds"]["ui4"].play()
+        self.click_sound.set_volume(self.engine.master_volume)
+        self.click_sound.play()
 
         if self.type == "start":
             self.engine.change_scene_transition("Game", 1.5)
@@ -110,19 +119,23 @@ class SettingsButton(Button):
 
         self.toggle = self.default_toggle
 
+        self.click_sound = self.engine.asset_manager.assets["sounds"]["ui4"]
+
         if self.type == "res":
             self.res_surfs = {
-                "1280x720": pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"res_1280x720"], self.window_ratio),
-                "1366x768": pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"res_1366x768"], self.window_ratio),
-                "1600x900": pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"res_1600x900"], self.window_ratio),
-                "1920x1080": pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"res_1920x1080"], self.window_ratio),
-                "2560x1440": pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"res_2560x1440"], self.window_ratio),
+                "1280x720": self.engine.asset_manager.get_scaled_image(f"res_1280x720", self.window_ratio),
+                "1366x768": self.engine.asset_manager.get_scaled_image(f"res_1366x768", self.window_ratio),
+                "1600x900": self.engine.asset_manager.get_scaled_image(f"res_1600x900", self.window_ratio),
+                "1920x1080": self.engine.asset_manager.get_scaled_image(f"res_1920x1080", self.window_ratio),
+                "2560x1440": self.engine.asset_manager.get_scaled_image(f"res_2560x1440", self.window_ratio),
             }
-            self.res_i = list(self.res_surfs.keys()).index(f"{self.default_w}x{self.default_h}")
+            # Indexed by res_i, kept as a tuple instead of rebuilding the key list
+            self.res_keys = tuple(self.res_surfs.keys())
+            self.res_i = self.res_keys.index(f"{self.default_w}x{self.default_h}")
 
         elif self.type == "hw":
-            self.on_surf = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"button_on"], self.window_ratio)
-            self.off_surf = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"][f"button_off"], self.window_ratio)
+            self.on_surf = self.engine.asset_manager.get_scaled_image(f"button_on", self.window_ratio)
+            self.off_surf = self.engine.asset_manager.get_scaled_image(f"button_off", self.window_ratio)
 
     def render_before(self) -> None:
         if self.type == "hw":
@@ -130,12 +143,12 @@ class SettingsButton(Button):
             self.engine.display.blit(surf, self.position)
 
         elif self.type == "res":
-            surf = self.res_surfs[list(self.res_surfs.keys())[self.res_i]]
+            surf = self.res_surfs[self.res_keys[self.res_i]]
             self.engine.display.blit(surf, self.position)
 
     def clicked_event(self) -> None:
-        self.engine.asset_manager.assets["sounds"]["ui4"].set_volume(self.engine.master_volume)
-        self.engine.asset_manager.assets["sounds"]["ui4"].play()
+        self.click_sound.set_volume(self.engine.master_volume)
+        self.click_sound.play()
 
         if self.type == "hw":
             self.toggle = not self.toggle
@@ -152,7 +165,7 @@ class SettingsButton(Button):
                 if self.res_i > len(self.res_surfs) - 1: self.res_i = len(self.res_surfs) - 1
 
     def get_res(self) -> tuple[int, int]:
-        k = list(self.res_surfs.keys())[self.res_i]
+        k = self.res_keys[self.res_i]
         s = k.split("x")
         return (int(s[0]), int(s[1]))
 
@@ -161,4 +174,4 @@ class SettingsButton(Button):
             return self.toggle != self.default_toggle
 
         elif self.type == "res":
-            return list(self.res_surfs.keys())[self.res_i] != f"{self.default_w}x{self.default_h}"
\ No newline at end of file
+            return self.res_keys[self.res_i] != f"{self.default_w}x{self.default_h}"
\ No newline at end of file
@@ -1,31 +1,49 @@
+from typing import TYPE_CHECKING
+
 from time import time
 
 import pygame
 
 from engine import Scene, Entity
 
+if TYPE_CHECKING:
+    from engine import Engine
+
 
 class Cursor(Entity):
     """
     Animated cursor handler.
     """
 
+    # Scaled frames and their cursors are the same for every scene
+    __cursor_anim = None
+    __cursors = None
+
     def __init__(self, scene: Scene):
         super().__init__(scene, pygame.Vector2())
 
-        self.cursor_anim = (
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["cursor"][0], 0.3),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["cursor"][1], 0.3),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["cursor"][2], 0.3)
-        )
+        self.cursor_anim, self.cursors = Cursor.get_cursors(self.engine)
         self.cursor_frame = 0
         self.cursor_last = time()
 
-        pygame.mouse.set_cursor(pygame.Cursor((3, 3), self.cursor_anim[0]))
+        pygame.mouse.set_cursor(self.cursors[0])
+
+    @classmethod
+    def get_cursors(cls, engine: "Engine") -> tuple[tuple[pygame.Surface, ...], tuple[pygame.Cursor, ...]]:
+        """ Get the scaled cursor frames and cursors, created on first use. """
+
+        if cls.__cursors is None:
+            cls.__cursor_anim = tuple(
+                pygame.transform.smoothscale_by(frame, 0.3)
+                for frame in engine.asset_manager.assets["animations"]["cursor"]
+            )
+            cls.__cursors = tuple(pygame.Cursor((3, 3), frame) for frame in cls.__cursor_anim)
+
+        return cls.__cursor_anim, cls.__cursors
 
     def update(self):
         now = time()
         if now - self.cursor_last > 1.0:
             self.cursor_last = now
-            self.cursor_frame = (self.cursor_frame + 1) % (len(self.cursor_anim))
-            pygame.mouse.set_cursor(pygame.Cursor((3, 3), self.cursor_anim[self.cursor_frame]))
\ No newline at end of file
+            self.cursor_frame = (self.cursor_frame + 1) % (len(self.cursors))
+            pygame.mouse.set_cursor(self.cursors[self.cursor_frame])
\ No newline at end of file
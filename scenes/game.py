@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING, Optional
 
 from time import perf_counter, time
-from math import pi, atan2, degrees, radians
-from random import uniform
+from math import pi, atan2, degrees, radians, cos, sin, hypot
+from random import uniform, random
+from collections import deque, OrderedDict
+from functools import lru_cache
 import array
 import json
 
@@ -11,6 +13,7 @@ import pymunk
 
 from engine import Scene, Entity
 from engine.draw import draw_shadow_text
+from engine.input import InputManager
 from engine.path import source_path
 
 from .cursor import Cursor
@@ -22,6 +25,87 @@ if TYPE_CHECKING:
     from engine import Engine
 
 
+# Input state indices, resolved once instead of by name on every query
+KEY_F2 = InputManager.key_index("f2")
+KEY_UP = InputManager.key_index("up")
+KEY_DOWN = InputManager.key_index("down")
+KEY_SPACE = InputManager.key_index("space")
+KEY_RETURN = InputManager.key_index("return")
+KEY_R = InputManager.key_index("r")
+KEY_Q = InputManager.key_index("q")
+KEY_P = InputManager.key_index("p")
+MOUSE_LEFT = InputManager.mouse_index("left")
+MOUSE_RIGHT = InputManager.mouse_index("right")
+
+# Rotated ice cube surfaces are cached at this many angles per type,
+# keeping at most ICECUBE_ROTATION_CACHE_SIZE of them around
+ICECUBE_ROTATION_STEPS = 360
+ICECUBE_ROTATION_STEP = 360.0 / ICECUBE_ROTATION_STEPS
+ICECUBE_ROTATION_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _load_level_data(level: int) -> dict:
+    """ Load level data, parsed only once and shared by game scenes. """
+    with open(source_path("assets", "levels", f"level{level}.json"), "r") as f:
+        return json.load(f)
+
+
+class ParticlePool:
+    """
+    Pool of reusable circle bodies for water particles.
+
+    Bodies are created once and added to / removed from the space as
+    particles are acquired and released.
+    """
+
+    def __init__(
+            self,
+            space: pymunk.Space,
+            size: int,
+            radius: float,
+            friction: float = 0.5,
+            restitution: float = 0.15,
+            density: float = 1.0
+            ) -> None:
+        self.space = space
+
+        # All particles have the same mass, compute it only once
+        mass = pi * radius * radius * density
+        moment = pymunk.moment_for_circle(mass, 0, radius, (0, 0))
+
+        self.__free = deque()
+        for _ in range(size):
+            body = pymunk.Body(mass, moment, pymunk.Body.DYNAMIC)
+            shape = pymunk.Circle(body, radius)
+            shape.friction = friction
+            shape.elasticity = restitution
+            self.__free.append((body, shape))
+
+    def acquire(
+            self,
+            position: pygame.Vector2 | tuple[float, float],
+            velocity: tuple[float, float] = (0.0, 0.0)
+            ) -> Optional[tuple[pymunk.Body, pymunk.Circle]]:
+        """ Add a body from the pool to the space, None if the pool is exhausted. """
+
+        if not self.__free: return None
+
+        body, shape = self.__free.pop()
+        body.position = (position[0], position[1])
+        body.velocity = velocity
+        body.angle = 0.0
+        body.angular_velocity = 0.0
+
+        self.space.add(body, shape)
+        return body, shape
+
+    def release(self, body: pymunk.Body, shape: pymunk.Circle) -> None:
+        """ Remove the body from the space and return it to the pool. """
+        self.space.remove(body, shape)
+        self.__free.append((body, shape))
+
+
 class RigidBody(Entity):
     def __init__(
             self,
@@ -42,17 +126,28 @@ class RigidBody(Entity):
         self.shape = shape
         self.size = size
         self.icecube_size = 0
-
-        if isinstance(self.shape, pymunk.Circle):
-            self.scene.particles.append(self)
+        self.is_icecube = False
 
         self.window_ratio = self.engine.window_width / 1280
+        self.pixel_scale = 10.0 * self.window_ratio
+        self.border_width = self.engine.window_width
+        self.border_height = self.engine.window_height
+
+        # Local polygon vertices and, for static bodies, their screen points
+        # which never change once computed
+        # Shape type is fixed, checked once instead of per frame
+        self.is_poly = isinstance(self.shape, pymunk.Poly)
+        if self.is_poly:
+            self.local_vertices = tuple((v.x, v.y) for v in self.shape.get_vertices())
+            # Screen space radius enclosing the polygon for visibility tests
+            self.bounding_radius = max(hypot(vx, vy) for vx, vy in self.local_vertices) * self.pixel_scale
+        self.poly_points = None
 
     @classmethod
     def from_box(
             cls,
             scene: "Scene",
-            position: pygame.Vector2,
+            position: pygame.Vector2 | tuple[float, float],
             size: tuple[float, float],
             angle: float = 0.0,
             friction: float = 0.5,
@@ -75,7 +170,7 @@ class RigidBody(Entity):
         if static: body = pymunk.Body(mass, moment, pymunk.Body.STATIC)
         else: body = pymunk.Body(mass, moment, pymunk.Body.DYNAMIC)
 
-        body.position = pymunk.Vec2d(position.x, position.y)
+        body.position = (position[0], position[1])
         body.angle = angle
 
         shape = pymunk.Poly(body, points)
@@ -89,7 +184,7 @@ class RigidBody(Entity):
     def from_circle(
             cls,
             scene: "Scene",
-            position: pygame.Vector2,
+            position: pygame.Vector2 | tuple[float, float],
             radius: float,
             angle: float = 0.0,
             friction: float = 0.5,
@@ -103,7 +198,7 @@ class RigidBody(Entity):
         if static: body = pymunk.Body(mass, moment, pymunk.Body.STATIC)
         else: body = pymunk.Body(mass, moment, pymunk.Body.DYNAMIC)
 
-        body.position = pymunk.Vec2d(position.x, position.y)
+        body.position = (position[0], position[1])
         body.angle = angle
 
         shape = pymunk.Circle(body, radius)
@@ -114,30 +209,45 @@ class RigidBody(Entity):
         return cls(scene, static, body, shape)
 
     def update(self):
-        phypos = self.body.position
-        self.phypos = pygame.Vector2(phypos.x, phypos.y)
-        self.position = self.phypos * 10.0 * self.window_ratio
-        border = pygame.Rect(0, 0, self.engine.window_width, self.engine.window_height)
-
-        if not border.collidepoint(self.position):
+        x, y = self.body.position
+        pixel_scale = self.pixel_scale
+        pos_x = x * pixel_scale
+        pos_y = y * pixel_scale
+        self.phypos.update(x, y)
+        self.position.update(pos_x, pos_y)
+
+        if not (0.0 <= pos_x < self.border_width and 0.0 <= pos_y < self.border_height):
             self.kill()
             self.scene.space.remove(self.body, self.shape)
-            if isinstance(self.shape, pymunk.Circle): self.scene.particles.remove(self)
-            else: self.scene.icecubes.remove(self)
-
-        if self.scene.temperature > 80 and isinstance(self.shape, pymunk.Circle):
-            strength = (self.scene.temperature - 80) * 55
-            force = (uniform(-strength, strength), uniform(-strength, strength))
-            self.body.apply_force_at_local_point(force, (0, 0))
+            if self.is_icecube: self.scene.icecubes.remove(self)
 
     def render_before(self):
         if self.scene.debug_drawing:
-            if isinstance(self.shape, pymunk.Poly):
-                points = []
-                angle = self.body.angle
-                for v in self.shape.get_vertices():
-                    p = v.rotated(angle) + self.phypos
-                    points.append((p.x * 10.0 * self.window_ratio, (p.y) * 10.0 * self.window_ratio))
+            if self.is_poly:
+                points = self.poly_points
+
+                if points is None:
+                    px, py = self.body.position
+                    pixel_scale = self.pixel_scale
+
+                    # Skip the transform and drawing for off-screen polygons
+                    cx = px * pixel_scale
+                    cy = py * pixel_scale
+                    r = self.bounding_radius
+                    if (cx + r < 0.0 or cx - r > self.border_width or
+                        cy + r < 0.0 or cy - r > self.border_height):
+                        return
+
+                    angle = self.body.angle
+                    c = cos(angle)
+                    s = sin(angle)
+
+                    points = [
+                        ((vx * c - vy * s + px) * pixel_scale, (vx * s + vy * c + py) * pixel_scale)
+                        for vx, vy in self.local_vertices
+                    ]
+
+                    if self.static: self.poly_points = points
 
                 pygame.draw.polygon(self.engine.display, (134, 179, 161), points, 0)
                 pygame.draw.polygon(self.engine.display, (0, 0, 0), points, 2)
@@ -147,12 +257,8 @@ class RigidBody(Entity):
         
 
         else:
-            if self in self.scene.icecubes:
-                if self.icecube_size == 0:
-                    surf = self.scene.icecube1
-                elif self.icecube_size == 1:
-                    surf = self.scene.icecube0
-                rotated = pygame.transform.rotate(surf, degrees(-self.body.angle))
+            if self.is_icecube:
+                rotated = self.scene.get_rotated_icecube(self.icecube_size, -self.body.angle)
                 self.engine.display.blit(rotated, rotated.get_rect(center=self.position))
 
 
@@ -170,6 +276,8 @@ class Game(Scene):
         # today was a good day
         self.icecube0 = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"]["icecube0"], self.window_ratio)
         self.icecube1 = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"]["icecube1"], self.window_ratio)
+        # Rotated ice cube surfaces by (type, rotation step), least recently used first
+        self.icecube_rotations = OrderedDict()
 
         self.textbox = DurkTextbox(self)
         self.cursor = Cursor(self)
@@ -185,19 +293,48 @@ class Game(Scene):
         self.space.gravity = (0.0, 50.0)
         self.sim_hz = 1.0 / 60.0
         self.step_time = 0.0
+        # Frame time not yet simulated, space is stepped at a fixed sim_hz
+        self.step_accumulator = 0.0
+        self.max_steps = 5
+
+        # Step time text is refreshed at 10Hz so it isn't rasterized every frame
+        self.step_text = ""
+        self.step_text_last = 0.0
+        self.debug_font = self.engine.asset_manager.get_font("FiraCode-Bold", 12)
+
+        # Rendered on first level clear
+        self.level_clear_surf = None
 
         self.debug_drawing = False
 
         self.drawing = False
         self.drawing_type = 0
-        self.drawing_start = pygame.Vector2()
-        self.drawing_end = pygame.Vector2()
+        self.drawing_start = (0.0, 0.0)
+        self.drawing_end = (0.0, 0.0)
 
         self.particle_size = 1.5 / 2.0
         self.max_particles = 5000
+        # Particles aren't entities, the scene simulates them in bulk and
+        # keeps their screen positions packed as x, y pairs in the staging
+        # buffer uploaded each frame
         self.particles = []
+        self.particle_buffer = array.array("f", bytes(self.max_particles * 2 * 4))
+        self.particle_pixel_scale = 10.0 * self.window_ratio2
         self.icecubes = []
 
+        # Positions of particles from melted ice waiting to be spawned, they
+        # are spawned over several frames within a time budget if needed
+        self.melt_queue = deque()
+        self.melt_budget = 0.002
+
+        self.particle_pool = ParticlePool(
+            self.space,
+            self.max_particles,
+            self.particle_size,
+            friction=0.0,
+            restitution=0.7
+        )
+
         self.water_post = WaterPostProcess(self)
 
         self.level_imgs = (
@@ -205,8 +342,8 @@ class Game(Scene):
             pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"]["level1"], self.window_ratio),
         )
         self.levels = (
-            json.load(open(source_path("assets", "levels", "level0.json"))),
-            json.load(open(source_path("assets", "levels", "level1.json"))),
+            _load_level_data(0),
+            _load_level_data(1),
         )
         self.current_level = 0
 
@@ -233,10 +370,10 @@ class Game(Scene):
     def load_level(self, level: int) -> None:
         if "bodies" not in self.levels[level]: return
 
-        for particle in self.particles:
-            particle.kill()
-            self.space.remove(particle.body, particle.shape)
+        for body, shape in self.particles:
+            self.particle_pool.release(body, shape)
         self.particles.clear()
+        self.melt_queue.clear()
 
         for b in self.icecubes:
             b.kill()
@@ -244,7 +381,7 @@ class Game(Scene):
         self.icecubes.clear()
 
         for e in self.entities:
-            if isinstance(e, RigidBody):
+            if isinstance(e, RigidBody) and e.alive:
                 e.kill()
                 self.space.remove(e.body, e.shape)
                 
@@ -273,15 +410,38 @@ class Game(Scene):
             width, height = 16.5, 16.5
         b = RigidBody.from_box(self, position / 10, (width, height), 0, restitution=0.5, friction=0.0, static=False)
         b.icecube_size = type_
+        b.is_icecube = True
         self.icecubes.append(b)
 
-    def spawn_particle(self, position: pygame.Vector2) -> None:
+    def get_rotated_icecube(self, type_: int, angle: float) -> pygame.Surface:
+        """ Get ice cube surface rotated by angle in radians, quantized to ICECUBE_ROTATION_STEPS. """
+
+        # A rotated large cube is about 0.6 MB at 1080p, so every degree of
+        # both types would take over 200 MB. Keeping the 64 most recently used
+        # stays under 40 MB, resting and slowly rotating cubes still hit it.
+        step = round(degrees(angle) / ICECUBE_ROTATION_STEP) % ICECUBE_ROTATION_STEPS
+        key = (type_, step)
+        rotations = self.icecube_rotations
+
+        surf = rotations.get(key)
+        if surf is None:
+            surf = pygame.transform.rotate(self.icecube1 if type_ == 0 else self.icecube0, step * ICECUBE_ROTATION_STEP)
+            rotations[key] = surf
+            if len(rotations) > ICECUBE_ROTATION_CACHE_SIZE: rotations.popitem(last=False)
+        else:
+            rotations.move_to_end(key)
+
+        return surf
+
+    def spawn_particle(self, position: pygame.Vector2 | tuple[float, float], velocity: tuple[float, float] = (0.0, 0.0)) -> None:
         # r = pygame.Vector2(uniform(-1.0, 1.0), uniform(-1.0, 1.0))
         # pos = self.engine.input.mouse / 10.0 / self.window_ratio2 + r
         # b = RigidBody.from_circle(self, pos, self.particle_size, restitution=0.7, friction=0.0, static=False)
         # b.body.velocity = pymunk.Vec2d(v.x, v.y)
 
-        b = RigidBody.from_circle(self, position, self.particle_size, restitution=0.7, friction=0.0, static=False)
+        # Nothing is spawned once the pool is exhausted
+        particle = self.particle_pool.acquire(position, velocity)
+        if particle is not None: self.particles.append(particle)
 
     def melt(self):
         for icecube in self.icecubes:
@@ -293,19 +453,36 @@ class Game(Scene):
             start0 = pygame.Vector2(points[0].x, points[0].y)
             end0 = pygame.Vector2(points[1].x, points[1].y)
             end1 = pygame.Vector2(points[3].x, points[3].y)
-            dir = (end0 - start0).normalize()
-            dir1 = (end1 - start0).normalize()
-            for j in range(round((end1 - start0).length() / (self.particle_size * 2))):
-                for i in range(round((end0 - start0).length() / (self.particle_size * 2))):
-                    pos = start0 + dir1 * j * (self.particle_size * 2) + dir * i * (self.particle_size * 2)
-                    pos.x += uniform(-0.1, 0.1) # This is to avoid perfectly stacking particles
-                    self.spawn_particle(pos)
+            step = self.particle_size * 2
+            dx, dy = (end0 - start0).normalize() * step
+            dx1, dy1 = (end1 - start0).normalize() * step
+            rows = round((end1 - start0).length() / step)
+            columns = round((end0 - start0).length() / step)
+
+            # Grid is walked with plain floats instead of vectors per particle
+            for j in range(rows):
+                row_x = start0.x + dx1 * j
+                row_y = start0.y + dy1 * j
+
+                for i in range(columns):
+                    x = row_x + dx * i + uniform(-0.1, 0.1) # This is to avoid perfectly stacking particles
+                    self.melt_queue.append((x, row_y + dy * i))
 
             icecube.kill()
             self.space.remove(icecube.body, icecube.shape)
 
         self.icecubes.clear()
 
+    def spawn_melted(self):
+        """ Spawn queued particles of melted ice until the frame budget runs out. """
+
+        queue = self.melt_queue
+        if not queue: return
+
+        start = perf_counter()
+        while queue and perf_counter() - start < self.melt_budget:
+            self.spawn_particle(queue.popleft())
+
     # def group_points(points, threshold):
     #     groups = []
     #     while len(points) > 0:
@@ -334,10 +511,12 @@ class Game(Scene):
         self.level_change_timer = time()
 
     def update(self):
-        if self.engine.input.key_pressed("f2"):
+        input_ = self.engine.input
+
+        if input_.key_pressed(KEY_F2):
             self.debug_drawing = not self.debug_drawing
 
-        if self.engine.input.mouse_wheel_up() or self.engine.input.key_pressed("up"):
+        if input_.mouse_wheel_up() or input_.key_pressed(KEY_UP):
             self.temperature += 10.0
             if self.temperature > self.temp_max:
                 self.temperature = self.temp_max
@@ -348,7 +527,7 @@ class Game(Scene):
                 if self.current_level == 0 and not self.textbox.visible:
                     self.level_clear()
 
-        if self.engine.input.mouse_wheel_down() or self.engine.input.key_pressed("down"):
+        if input_.mouse_wheel_down() or input_.key_pressed(KEY_DOWN):
             self.temperature -= 10.0
             if self.temperature < self.temp_min:
                 self.temperature = self.temp_min
@@ -356,42 +535,46 @@ class Game(Scene):
             if self.temperature < 10.1:
                 self.freeze()
 
-        # if self.engine.input.key_held("lshift"):
-        #     if self.engine.input.mouse_pressed("left"):
+        # if input_.key_held("lshift"):
+        #     if input_.mouse_pressed("left"):
         #         self.drawing = True
         #         self.drawing_type = 0
-        #         self.drawing_start = self.engine.input.mouse.copy()
+        #         self.drawing_start = tuple(input_.mouse)
 
-        #     elif self.engine.input.mouse_pressed("right"):
+        #     elif input_.mouse_pressed("right"):
         #         self.drawing = True
         #         self.drawing_type = 1
-        #         self.drawing_start = self.engine.input.mouse.copy()
+        #         self.drawing_start = tuple(input_.mouse)
 
-        if self.engine.input.mouse_released("left") or self.engine.input.mouse_released("right"):
+        if input_.mouse_released(MOUSE_LEFT) or input_.mouse_released(MOUSE_RIGHT):
             if self.drawing:
                 self.drawing = False
-                self.drawing_end = self.engine.input.mouse.copy()
+                self.drawing_end = tuple(input_.mouse)
 
                 e = 0.7
                 u = 0.0
 
+                sx, sy = self.drawing_start
+                ex, ey = self.drawing_end
+
                 if self.drawing_type == 0:
-                    delta = (self.drawing_end - self.drawing_start) / 10.0
-                    position = self.drawing_start / 10 + delta / 2.0
-                    angle = atan2(delta.y, delta.x)
+                    dx = (ex - sx) / 10.0
+                    dy = (ey - sy) / 10.0
+                    position = (sx / 10.0 + dx / 2.0, sy / 10.0 + dy / 2.0)
+                    angle = atan2(dy, dx)
 
-                    b = RigidBody.from_box(self, position, (delta.length(), 2.0), angle, restitution=e, friction=u, static=True)
+                    b = RigidBody.from_box(self, position, (hypot(dx, dy), 2.0), angle, restitution=e, friction=u, static=True)
                     b.z_index = 1
 
                 elif self.drawing_type == 1:
-                    width = (self.drawing_end.x - self.drawing_start.x) / 10
-                    height = (self.drawing_end.y - self.drawing_start.y) / 10
-                    center = (self.drawing_start + self.drawing_end) / 20
+                    width = (ex - sx) / 10
+                    height = (ey - sy) / 10
+                    center = ((sx + ex) / 20, (sy + ey) / 20)
 
                     b = RigidBody.from_box(self, center, (width, height), 0, restitution=e, friction=u, static=True)
                     b.z_index = 1
 
-        if (self.engine.input.key_pressed("space") or self.engine.input.key_pressed("return")) and self.textbox.done and self.textbox.visible:
+        if (input_.key_pressed(KEY_SPACE) or input_.key_pressed(KEY_RETURN)) and self.textbox.done and self.textbox.visible:
             
             if self.textbox_slide == len(self.textbox_slides):
                 self.textbox.hide()
@@ -402,17 +585,19 @@ class Game(Scene):
                 self.textbox.say(self.textbox_slides[self.textbox_slide][0], self.textbox_slides[self.textbox_slide][1])
                 self.textbox_slide += 1
 
-        if self.engine.input.key_pressed("r") and self.current_level > 0:
+        if input_.key_pressed(KEY_R) and self.current_level > 0:
             self.load_level(self.current_level)
 
-        if self.engine.input.key_held("q"):
-            v = self.engine.input.mouse_rel * 3.0
+        if input_.key_held(KEY_Q):
+            # Plain floats, no need for temporary vectors per particle
+            scale = 0.1 / self.window_ratio2
+            mx = input_.mouse.x * scale
+            my = input_.mouse.y * scale
+            velocity = (input_.mouse_rel.x * 3.0, input_.mouse_rel.y * 3.0)
 
+            # Offset in [-1, 1) around the cursor, like the heat jitter force
             for _ in range(3):
-                r = pygame.Vector2(uniform(-1.0, 1.0), uniform(-1.0, 1.0))
-                pos = self.engine.input.mouse / 10.0 / self.window_ratio2 + r
-                b = RigidBody.from_circle(self, pos, self.particle_size, restitution=0.7, friction=0.0, static=False)
-                b.body.velocity = pymunk.Vec2d(v.x, v.y)
+                self.spawn_particle((mx + random() * 2.0 - 1.0, my + random() * 2.0 - 1.0), velocity)
 
         if self.level_change:
             if time() - self.level_change_timer > 3.0:
@@ -420,10 +605,10 @@ class Game(Scene):
                 self.load_level(self.current_level)
                 self.level_change = False
 
-        if self.engine.input.key_pressed("p"):
+        if input_.key_pressed(KEY_P):
             level_save = {"bodies": []}
             for body in self.entities:
-                if isinstance(body, RigidBody) and isinstance(body.shape, pymunk.Poly):
+                if isinstance(body, RigidBody) and body.alive and body.is_poly:
                     level_save["bodies"].append(
                         {
                             "position": [body.body.position.x, body.body.position.y],
@@ -437,10 +622,67 @@ class Game(Scene):
 
             print(json.dumps(level_save))
 
+        self.spawn_melted()
+
         step_time_start = perf_counter()
-        self.space.step(self.sim_hz)
+
+        self.step_accumulator += self.engine.dt
+        steps = 0
+        while self.step_accumulator >= self.sim_hz and steps < self.max_steps:
+            # Forces are cleared after every step, so they are applied per step
+            self.jitter_particles()
+            self.space.step(self.sim_hz)
+            self.step_accumulator -= self.sim_hz
+            steps += 1
+
+        # Drop the time that couldn't be caught up instead of spiraling
+        if steps == self.max_steps: self.step_accumulator = 0.0
+
         self.step_time = perf_counter() - step_time_start
 
+        self.update_particles()
+
+    def jitter_particles(self):
+        """ Apply a random force to particles when it's hot, for the next step. """
+
+        if self.temperature <= 80: return
+
+        strength = (self.temperature - 80) * 55
+        span = strength * 2.0
+
+        # Same as uniform(-strength, strength) without the extra call.
+        # Particles only get this force, so it can be set directly.
+        for body, _ in self.particles:
+            body.force = (random() * span - strength, random() * span - strength)
+
+    def update_particles(self):
+        """ Cull particles off the screen and pack positions of the rest. """
+
+        buffer = self.particle_buffer
+        pixel_scale = self.particle_pixel_scale
+        width = self.engine.window_width
+        height = self.engine.window_height
+        release = self.particle_pool.release
+
+        alive = []
+        i = 0
+        for particle in self.particles:
+            body = particle[0]
+            x, y = body.position
+            x *= pixel_scale
+            y *= pixel_scale
+
+            if 0.0 <= x < width and 0.0 <= y < height:
+                buffer[i] = x
+                buffer[i + 1] = y
+                i += 2
+                alive.append(particle)
+
+            else:
+                release(*particle)
+
+        self.particles = alive
+
     def render_before(self):
         self.engine.display.blit(self.bg, (0, 0))
         self.engine.display.blit(self.level_imgs[self.current_level], (0, 0))
@@ -451,18 +693,26 @@ class Game(Scene):
                 pygame.draw.line(self.engine.display, (255, 255, 255), self.drawing_start, self.engine.input.mouse)
 
             elif self.drawing_type == 1:
-                width = self.engine.input.mouse.x - self.drawing_start.x
-                height = self.engine.input.mouse.y - self.drawing_start.y
+                width = self.engine.input.mouse.x - self.drawing_start[0]
+                height = self.engine.input.mouse.y - self.drawing_start[1]
                 pygame.draw.rect(self.engine.display, (255, 255, 255), (self.drawing_start, (width, height)), 1)
 
         if self.level_change:
-            font = self.engine.asset_manager.get_font("LoveYaLikeASister", 160)
-            surf = font.render("Level Clear!", True, (69, 19, 13)).convert_alpha()
+            if self.level_clear_surf is None:
+                font = self.engine.asset_manager.get_font("LoveYaLikeASister", 160)
+                self.level_clear_surf = font.render("Level Clear!", True, (69, 19, 13)).convert_alpha()
+
+            surf = self.level_clear_surf
             w, h = surf.get_size()
             self.engine.display.blit(surf, (self.engine.scaled_width/2 - w/2, self.engine.scaled_height/2 - h/2))
 
         if self.engine.stat_drawing == 2:
-            font = self.engine.asset_manager.get_font("FiraCode-Bold", 12)
+            font = self.debug_font
+
+            now = time()
+            if now - self.step_text_last > 0.1:
+                self.step_text = f"Step: {round(self.step_time * 1000, 2)}ms"
+                self.step_text_last = now
 
             draw_shadow_text(
                 self.engine.display,
@@ -475,7 +725,7 @@ class Game(Scene):
             draw_shadow_text(
                 self.engine.display,
                 font,
-                f"Step: {round(self.step_time * 1000, 2)}ms",
+                self.step_text,
                 (5, self.engine.window_height - 5 - 14 * 2),
                 (255, 255, 255)
             )
@@ -489,11 +739,23 @@ class Game(Scene):
             )
 
     def render_post(self):
-        # Update particles buffer with new particle positions
-        if not self.debug_drawing:
-            self.water_post.particle_vbo.clear()
-            self.water_post.particle_vbo.write(
-                array.array("f", [c for p in self.particles for c in [p.position.x, p.position.y]])
-            )
+        # Final FBO already holds the display, nothing is drawn over it without water
+        if not self.particles: return
 
-            self.water_post.render()
+        # Update particles buffer with new particle positions
+        # Positions are packed by update_particles, the VBO is
+        # overwritten from the start so there is no need to clear it
+        # Orphan first so the write doesn't wait on last frame's draw
+        n = len(self.particles) * 2
+        buffer = self.particle_buffer
+        particle_vbo = self.water_post.particle_vbo
+        particle_vbo.orphan()
+        particle_vbo.write(memoryview(buffer)[:n])
+
+        if self.debug_drawing:
+            self.water_post.render_debug()
+        else:
+            # Strided slices are copied and reduced in C
+            xs = buffer[0:n:2]
+            ys = buffer[1:n:2]
+            self.water_post.render((min(xs), min(ys), max(xs), max(ys)))
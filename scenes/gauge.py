@@ -3,10 +3,6 @@ import pygame
 from engine import Scene, Entity
 
 
-def map_range(x: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
-    return (x - in_min) * (out_max - out_min) / (in_max - in_min) + out_min
-
-
 class Gauge(Entity):
     """
     Thermometer gauge.
@@ -17,22 +13,15 @@ class Gauge(Entity):
 
         self.window_ratio = self.engine.window_width / 1920
 
-        self.overlay = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][0], self.window_ratio)
-
-        self.frames = (
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][1], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][2], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][3], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][4], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][5], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][6], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][7], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][8], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][9], self.window_ratio),
-            pygame.transform.smoothscale_by(self.engine.asset_manager.assets["animations"]["gauge"][10], self.window_ratio)
-        )
+        ratio = self.window_ratio
+        gauge_frames = self.engine.asset_manager.assets["animations"]["gauge"]
+
+        self.overlay = pygame.transform.smoothscale_by(gauge_frames[0], ratio)
+        self.frames = tuple(pygame.transform.smoothscale_by(frame, ratio) for frame in gauge_frames[1:11])
 
     def render_before(self):
-        frame = int(map_range(self.scene.temperature, self.scene.temp_min, self.scene.temp_max, 0, 9))
+        # Temperature mapped onto the 10 gauge frames
+        scene = self.scene
+        frame = int((scene.temperature - scene.temp_min) * 9.0 / (scene.temp_max - scene.temp_min))
         self.engine.display.blit(self.frames[frame], (0, 0))
         self.engine.display.blit(self.overlay, (0, 0))
\ No newline at end of file
@@ -24,34 +24,27 @@ class Menu(Scene):
 
         self.window_ratio = self.engine.window_width / 1920
 
-        size = (310 * self.window_ratio, 180 * self.window_ratio)
+        r = self.window_ratio
+        x = self.engine.window_width - 550 * r
+        size = (310 * r, 180 * r)
 
         self.start_btn = MenuButton(
             self,
-            pygame.Vector2(
-                self.engine.window_width - 550 * self.window_ratio,
-                self.engine.window_height - 700 * self.window_ratio
-            ),
+            pygame.Vector2(x, self.engine.window_height - 700 * r),
             size,
             "start"
         )
 
         self.settings_btn = MenuButton(
             self,
-            pygame.Vector2(
-                self.engine.window_width - 550 * self.window_ratio,
-                self.engine.window_height - 500 * self.window_ratio
-            ),
+            pygame.Vector2(x, self.engine.window_height - 500 * r),
             size,
             "settings"
         )
 
         self.quit_btn = MenuButton(
             self,
-            pygame.Vector2(
-                self.engine.window_width - 550 * self.window_ratio,
-                self.engine.window_height - 300 * self.window_ratio
-            ),
+            pygame.Vector2(x, self.engine.window_height - 300 * r),
             size,
             "quit"
         )
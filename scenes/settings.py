@@ -31,23 +31,31 @@ class Settings(Scene):
 
         self.save = pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"]["button_saverestart"], self.window_ratio)
 
+        # Background with the save button already drawn, shown once a setting changes
+        self.bg_save = self.bg.copy()
+        self.bg_save.blit(self.save, (0, 0))
+
         self.init_btns()
 
     def init_btns(self):
+        r = self.window_ratio
+
         self.res_btn = SettingsButton(
             self,
-            pygame.Vector2(1098 * self.window_ratio, 298 * self.window_ratio),
-            (384 * self.window_ratio, 83 * self.window_ratio),
+            pygame.Vector2(1098 * r, 298 * r),
+            (384 * r, 83 * r),
             "res"
         )
 
         self.hw_btn = SettingsButton(
             self,
-            pygame.Vector2(1280 * self.window_ratio, 385 * self.window_ratio),
-            (149 * self.window_ratio, 90 * self.window_ratio),
+            pygame.Vector2(1280 * r, 385 * r),
+            (149 * r, 90 * r),
             "hw"
         )
 
+        self.settings_changed = False
+
     def save_settings(self):
         cwd = os.getcwd()
         settings_path = os.path.join(cwd, "settings.cfg")
@@ -68,6 +76,10 @@ quality = 3
             """)
 
     def update(self):
+        # Buttons are updated before the scene, so a click is already applied here
+        if self.engine.input.mouse_released("left"):
+            self.settings_changed = self.res_btn.changed() or self.hw_btn.changed()
+
         if self.engine.input.mouse_pressed("left"):
             if self.engine.input.mouse.x < 150 * self.window_ratio and self.engine.input.mouse.y < 100 * self.window_ratio:
                 self.engine.change_scene("Menu")
@@ -79,7 +91,4 @@ quality = 3
                 self.engine.stop()
 
     def render_before(self):
-        self.engine.display.blit(self.bg, (0, 0))
-
-        if self.res_btn.changed() or self.hw_btn.changed():
-            self.engine.display.blit(self.save, (0, 0))
\ No newline at end of file
+        self.engine.display.blit(self.bg_save if self.settings_changed else self.bg, (0, 0))
\ No newline at end of file
@@ -4,12 +4,22 @@ from math import pi, cos
 import pygame
 
 from engine import Scene, Entity
+from engine.input import InputManager
+
+
+# Input state indices, resolved once instead of by name on every query
+KEY_SPACE = InputManager.key_index("space")
+KEY_RETURN = InputManager.key_index("return")
 
 
 def ease_in_out_sine(x: float) -> float:
     return -(cos(pi * x) - 1) / 2
 
 
+# Easing sampled once, the show/hide animation lasts about a second
+EASE_LUT = tuple(ease_in_out_sine(i / 255) for i in range(256))
+
+
 class DurkTextbox(Entity):
     """
     Dr. Durk's textbox.
@@ -27,9 +37,19 @@ class DurkTextbox(Entity):
             pygame.transform.smoothscale_by(self.engine.asset_manager.assets["images"]["textbox1"], self.window_ratio)
         )
 
+        self.font = self.engine.asset_manager.get_font("LoveYaLikeASister", int(45 * self.window_ratio))
+
+        # Text offset in whole pixels, relative to the textbox top
+        self.text_x = int(655 * self.window_ratio)
+        self.text_y = int(220 * self.window_ratio)
+
         self.image = 0
         self.text = ""
         self.displayed_text = ""
+
+        # Text is only rendered again when a new character is displayed
+        self.text_surf = None
+        self.text_surf_text = None
         self.cursor = 0
         self.done = True
         self.last = time()
@@ -48,16 +68,18 @@ class DurkTextbox(Entity):
         self.anim_type = 0
 
     def update(self):
+        input_ = self.engine.input
+
         if self.delay > 0.0:
             if time() - self.delay_last >= self.delay:
                 self.delay = 0.0
             else:
                 return
                 
-        if self.engine.input.key_pressed("space") or self.engine.input.key_pressed("return"):
+        if input_.key_pressed(KEY_SPACE) or input_.key_pressed(KEY_RETURN):
             self.last = time()
 
-        if self.engine.input.key_held("space") or self.engine.input.key_held("return"):
+        if input_.key_held(KEY_SPACE) or input_.key_held(KEY_RETURN):
             self.duration = self.duration_quick
         else:
             self.duration = self.duration_normal
@@ -83,25 +105,34 @@ class DurkTextbox(Entity):
             t = (time() - self.show_start) / self.ease_duration
             if t > 1: t = 1
 
+            y = EASE_LUT[int(t * 255)] * ih
+
             if self.anim_type == 0:
-                y = ease_in_out_sine(t) * ih
-                self.engine.display.blit(self.textboxes[self.image], (0, self.engine.window_height - y))
+                box_y = self.engine.window_height - y
             
-            elif self.anim_type == 1:
-                y = ease_in_out_sine(t) * ih
+            else:
+                box_y = h + y
                 texty = y
-                self.engine.display.blit(self.textboxes[self.image], (0, h + y))
                 if t >= 1: self.visible = False
 
+            # Textbox and text are drawn with a single fblits call
+            blits = [(self.textboxes[self.image], (0, box_y))]
+
             if self.displayed_text:
-                font = self.engine.asset_manager.get_font("LoveYaLikeASister", int(45 * self.window_ratio))
-                s = font.render(self.displayed_text, True, (92, 60, 55))
-                self.engine.display.blit(s, (655 * self.window_ratio, h + 220 * self.window_ratio + texty))
-
-                if self.cursor < len(self.text) - 1:
-                    s = font.render(self.displayed_text + self.text[self.cursor + 1], True, (92, 60, 55))
-                    if s.get_width() > (1790 - 655) * self.window_ratio:
-                        self.displayed_text += "\n"
+                if self.displayed_text != self.text_surf_text:
+                    # Wrap before the next character if it wouldn't fit, only
+                    # the last line needs measuring as previous ones are wrapped
+                    if self.cursor < len(self.text) - 1:
+                        line = (self.displayed_text + self.text[self.cursor + 1]).rsplit("\n", 1)[-1]
+                        if self.font.size(line)[0] > (1790 - 655) * self.window_ratio:
+                            self.displayed_text += "\n"
+
+                    self.text_surf = self.font.render(self.displayed_text, True, (92, 60, 55))
+                    self.text_surf_text = self.displayed_text
+
+                blits.append((self.text_surf, (self.text_x, int(h + self.text_y + texty))))
+
+            self.engine.display.fblits(blits)
 
     def say(self, image: int, text: str, delay: float = 0.0):
         self.image = image
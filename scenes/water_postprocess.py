@@ -1,4 +1,6 @@
-from time import time
+from time import perf_counter
+
+import array
 
 import moderngl
 
@@ -12,8 +14,11 @@ class WaterPostProcess:
 
     Rendering Phases:
     -----------------
-    1.              2.      3.                4.       5.
-    Batch render -> blur -> fake metaballs -> water -> blur water
+    1.              2.      3.       4.
+    Batch render -> blur -> water -> blur water
+
+    Fake metaballs are made by cutting the blurred particles off at a
+    threshold, done inline where the water and blur water phases sample it.
     """
 
     def __init__(self, scene: Scene):
@@ -23,17 +28,6 @@ class WaterPostProcess:
 
         self.blur = BasicScreenQuad(
             self.engine,
-            vertex_shader=
-"""
-#version 330
-in vec2 in_position;
-in vec2 in_uv;
-out vec2 v_uv;
-void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = vec2(in_uv.x, in_uv.y);
-}
-""",
             fragment_shader=
 """
 #version 330
@@ -46,162 +40,175 @@ out vec4 out_color;
 uniform vec2 u_resolution;
 uniform sampler2D s_texture;
 
-#define TAU 6.28318530718
-#define DIRS 24.0   // Blur directions
+#define DIRS 24     // Blur directions
 #define QUALITY 3.0 // Blur quality
 #define SIZE 12.0    // Blur size
 
+// Unit vectors of the blur directions, TAU / DIRS apart
+const vec2 DIRECTIONS[24] = vec2[24](
+    vec2(1.000000, 0.000000),
+    vec2(0.965926, 0.258819),
+    vec2(0.866025, 0.500000),
+    vec2(0.707107, 0.707107),
+    vec2(0.500000, 0.866025),
+    vec2(0.258819, 0.965926),
+    vec2(0.000000, 1.000000),
+    vec2(-0.258819, 0.965926),
+    vec2(-0.500000, 0.866025),
+    vec2(-0.707107, 0.707107),
+    vec2(-0.866025, 0.500000),
+    vec2(-0.965926, 0.258819),
+    vec2(-1.000000, 0.000000),
+    vec2(-0.965926, -0.258819),
+    vec2(-0.866025, -0.500000),
+    vec2(-0.707107, -0.707107),
+    vec2(-0.500000, -0.866025),
+    vec2(-0.258819, -0.965926),
+    vec2(0.000000, -1.000000),
+    vec2(0.258819, -0.965926),
+    vec2(0.500000, -0.866025),
+    vec2(0.707107, -0.707107),
+    vec2(0.866025, -0.500000),
+    vec2(0.965926, -0.258819)
+);
+
 void main() {
     vec2 radius = SIZE / u_resolution;
 
-    vec4 color = texture(s_texture, v_uv);
-
-    float inv_quality = 1.0 / QUALITY;
+    // Particle mask is single channel
+    float value = texture(s_texture, v_uv).r;
 
-    for (float d = 0.0; d < TAU; d += TAU / DIRS) {
-        for(float i = inv_quality; i <= 1.0; i += inv_quality) {
-            color += texture(s_texture, v_uv + vec2(cos(d), sin(d)) * radius * i);		
-        }
+    for (int d = 0; d < DIRS; d++) {
+        vec2 offset = DIRECTIONS[d] * radius;
+        value += texture(s_texture, v_uv + offset * (1.0 / 3.0)).r;
+        value += texture(s_texture, v_uv + offset * (2.0 / 3.0)).r;
+        value += texture(s_texture, v_uv + offset).r;
     }
 
-    color /= QUALITY * DIRS - 15.0;
-    out_color = color;
+    value /= QUALITY * float(DIRS) - 15.0;
+    out_color = vec4(value);
 }
 """
         )
         self.blur.shader["u_resolution"] = (self.engine.window_width, self.engine.window_height)
 
+        # Each particle is an instance of this quad, expanded by u_size
+        self.particle_quad_vbo = self.engine.context.buffer(
+            array.array("f", [
+                -1.0, -1.0,
+                1.0, -1.0,
+                -1.0,  1.0,
+                1.0,  1.0,
+            ])
+        )
+
         self.particle_shader = self.engine.context.program(
             vertex_shader=
 """
 #version 330
+in vec2 in_corner;
 in vec2 in_position;
+out vec2 v_uv;
 uniform vec2 u_resolution;
+uniform vec2 u_size;
 void main() {
     // Map coordinates inside display
     vec2 pos = vec2(
         (in_position.x / u_resolution.x - 0.5) * 2.0,
         (in_position.y / u_resolution.y - 0.5) * 2.0
     );
-    gl_Position = vec4(pos, 0.0, 1.0);
+    gl_Position = vec4(pos + in_corner * u_size / u_resolution, 0.0, 1.0);
+    v_uv = vec2(in_corner.x, -in_corner.y) * 0.5 + 0.5;
 }
 """,
             fragment_shader=
 """
 #version 330
-in vec2 g_uv;
+in vec2 v_uv;
 out vec4 out_color;
 uniform sampler2D s_texture;
 void main() {
-    //out_color = texture(s_texture, g_uv);
+    //out_color = texture(s_texture, v_uv);
     //out_color = vec4(1.0);
     vec3 color;
-    if (distance(g_uv, vec2(0.5, 0.5)) < 0.5)
+    if (distance(v_uv, vec2(0.5, 0.5)) < 0.5)
         out_color = vec4(1.0, 1.0, 1.0, 1.0);
     else
         out_color = vec4(0.0, 0.0, 0.0, 0.0);
 }
-""",
-            geometry_shader=
-"""
-#version 330
-layout (points) in;
-layout (triangle_strip, max_vertices = 4) out;
-
-out vec2 g_uv;
-
-uniform vec2 u_resolution;
-uniform vec2 u_size;
-
-void main() {
-    float w = u_size.x / u_resolution.x;
-    float h = u_size.y / u_resolution.y;
-    gl_Position = gl_in[0].gl_Position + vec4(-w, -h, 0.0, 0.0);
-    g_uv = vec2(0.0, 1.0);
-    EmitVertex();
-    gl_Position = gl_in[0].gl_Position + vec4(w, -h, 0.0, 0.0);
-    g_uv = vec2(1.0, 1.0);
-    EmitVertex();
-    gl_Position = gl_in[0].gl_Position + vec4(-w,  h, 0.0, 0.0);
-    g_uv = vec2(0.0, 0.0);
-    EmitVertex();
-    gl_Position = gl_in[0].gl_Position + vec4(w,  h, 0.0, 0.0);
-    g_uv = vec2(1.0, 0.0);
-    EmitVertex();
-    
-    EndPrimitive();
-}
 """
         )
         self.particle_shader["u_resolution"] = (self.engine.window_width, self.engine.window_height)
         size = self.scene.particle_size * 2.0 * 10.0 * self.window_ratio
         self.particle_shader["u_size"] = (size, size)
 
+        # Farthest the water passes read or write from a particle center in
+        # pixels: particle radius, metaball blur size, water edge detection
+        # radius, water blur size and a few pixels of rounding
+        edge_radius = 0.0035 * max(self.engine.window_width, self.engine.window_height)
+        self.water_reach = size / 2.0 + 12.0 + edge_radius + 4.0 + 4.0
+
         # 2 floats (4 bytes)
         self.particle_stride = 2 * 4
-        self.particle_vbo = self.engine.context.buffer(reserve=self.scene.max_particles * self.particle_stride)
+        self.particle_vbo = self.engine.context.buffer(reserve=self.scene.max_particles * self.particle_stride, dynamic=True)
 
         self.particle_vao = self.engine.context.vertex_array(
             self.particle_shader,
             (
-                self.particle_vbo.bind("in_position", layout="2f"),
+                self.particle_quad_vbo.bind("in_corner", layout="2f"),
+                self.particle_vbo.bind("in_position", layout="2f/i"),
             )
         )
 
-        self.second_phase = BasicScreenQuad(
-            self.engine,
+        # Debug view draws particle outlines directly on the final FBO in one
+        # draw call, using the same particle buffer
+        self.debug_particle_shader = self.engine.context.program(
             vertex_shader=
 """
 #version 330
+in vec2 in_corner;
 in vec2 in_position;
-in vec2 in_uv;
 out vec2 v_uv;
+uniform vec2 u_resolution;
+uniform vec2 u_size;
 void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = vec2(in_uv.x, in_uv.y);
+    // Final FBO is upright, so Y is flipped unlike the water phases
+    vec2 pos = vec2(
+        (in_position.x / u_resolution.x - 0.5) * 2.0,
+        (0.5 - in_position.y / u_resolution.y) * 2.0
+    );
+    gl_Position = vec4(pos + in_corner * u_size / u_resolution, 0.0, 1.0);
+    v_uv = vec2(in_corner.x, -in_corner.y) * 0.5 + 0.5;
 }
 """,
             fragment_shader=
 """
 #version 330
-
 in vec2 v_uv;
 out vec4 out_color;
-
-uniform sampler2D s_texture;
-
-#define THRESHOLD 0.2
-
+uniform vec2 u_size;
 void main() {
-    vec4 color = texture(s_texture, v_uv);
-
-    vec3 bottom = vec3(24.0 / 255.0, 37.0 / 255.0, 217.0 / 255.0);
-    vec3 top = vec3(92.0 / 255.0, 138.0 / 255.0, 1.0);
-
-    if (color.a <= THRESHOLD)
-        out_color = vec4(0.0);
-    else {
-        //vec3 c = bottom * (1.0 - v_uv.y) + top * v_uv.y;
-        vec3 c = vec3(1.0);
-        out_color = vec4(c, 1.0);
-    }
+    // One pixel wide outline
+    float dist = distance(v_uv, vec2(0.5, 0.5));
+    if (dist > 0.5 || dist < 0.5 - 1.0 / u_size.x)
+        discard;
+    out_color = vec4(0.0, 0.0, 0.0, 1.0);
 }
 """
         )
+        self.debug_particle_shader["u_resolution"] = (self.engine.window_width, self.engine.window_height)
+        self.debug_particle_shader["u_size"] = (size, size)
+
+        self.debug_particle_vao = self.engine.context.vertex_array(
+            self.debug_particle_shader,
+            (
+                self.particle_quad_vbo.bind("in_corner", layout="2f"),
+                self.particle_vbo.bind("in_position", layout="2f/i"),
+            )
+        )
 
         self.water = BasicScreenQuad(
             self.engine,
-            vertex_shader=
-"""
-#version 330
-in vec2 in_position;
-in vec2 in_uv;
-out vec2 v_uv;
-void main() {
-    gl_Position = vec4(in_position, 0.0, 1.0);
-    v_uv = vec2(in_uv.x, in_uv.y);
-}
-""",
             fragment_shader=
 """
 #version 330
@@ -241,26 +248,62 @@ uniform sampler2D s_texture1;
 #define WATER_COLOR vec3(0.188, 0.823, 1.0)
 #define WATER_MIX 0.1
 
+// Fake metaballs
+#define THRESHOLD 0.2
+
+// (cos, sin) of each step's angle, 2 * PI / ANGLE apart
+const vec2 ANGLES[8] = vec2[8](
+    vec2(1.000000, 0.000000),
+    vec2(0.623490, 0.781831),
+    vec2(-0.222521, 0.974928),
+    vec2(-0.900969, 0.433884),
+    vec2(-0.900969, -0.433884),
+    vec2(-0.222521, -0.974928),
+    vec2(0.623490, -0.781831),
+    vec2(1.000000, 0.000000)
+);
+
+// Unit vectors of the edge detection directions, TAU / 16 apart
+const vec2 EDGE_DIRECTIONS[16] = vec2[16](
+    vec2(1.000000, 0.000000),
+    vec2(0.923880, 0.382683),
+    vec2(0.707107, 0.707107),
+    vec2(0.382683, 0.923880),
+    vec2(0.000000, 1.000000),
+    vec2(-0.382683, 0.923880),
+    vec2(-0.707107, 0.707107),
+    vec2(-0.923880, 0.382683),
+    vec2(-1.000000, 0.000000),
+    vec2(-0.923880, -0.382683),
+    vec2(-0.707107, -0.707107),
+    vec2(-0.382683, -0.923880),
+    vec2(0.000000, -1.000000),
+    vec2(0.382683, -0.923880),
+    vec2(0.707107, -0.707107),
+    vec2(0.923880, -0.382683)
+);
+
 float col(vec2 coord, float time) {
-    float delta_theta = 2.0 * PI / float(ANGLE);
     float col = 0.0;
-    float theta = 0.0;
 
     for (int i = 0; i < STEPS; i++) {
         vec2 adjc = coord;
-        theta = delta_theta * float(i);
-        adjc.x += cos(theta) * time * SPEED + time * SPEED_X;
-        adjc.y -= sin(theta) * time * SPEED - time * SPEED_Y;
-        col = col + cos((adjc.x * cos(theta) - adjc.y * sin(theta)) * FREQUENCY) * INTENSITY;
+        vec2 theta = ANGLES[i];
+        adjc.x += theta.x * time * SPEED + time * SPEED_X;
+        adjc.y -= theta.y * time * SPEED - time * SPEED_Y;
+        col = col + cos((adjc.x * theta.x - adjc.y * theta.y) * FREQUENCY) * INTENSITY;
     }
 
     return cos(col);
 }
 
-void main() {
-    vec4 frag0 = texture(s_texture0, v_uv);
+// Blurred particles above the threshold are water
+bool is_water(vec2 uv) {
+    return texture(s_texture0, uv).r > THRESHOLD;
+}
 
-    if (frag0.r == 1.0) {
+void main() {
+    if (is_water(v_uv)) {
         vec2 p = vec2(v_uv.x, 1.0 - v_uv.y);
         vec2 c1 = p;
         vec2 c2 = p;
@@ -287,16 +330,24 @@ void main() {
 
         vec4 refl = frag1 * (alpha);
 
-        //vec4 final_col = mix(refl, vec4(WATER_COLOR.bgr, 1.0), WATER_MIX);
-        vec4 final_col = refl * vec4(WATER_COLOR.bgr, 1.0);
+        //vec4 final_col = mix(refl, vec4(WATER_COLOR, 1.0), WATER_MIX);
+        vec4 final_col = refl * vec4(WATER_COLOR, 1.0);
 
-        float inv_quality = 1.0/3.0;
         float radius = 0.0035;
-        float DIRS = 16.0;
+
+        // Most water pixels are far from the edge, when the outer ring is
+        // water in every 45 degrees the full edge detection is skipped
+        bool interior = true;
+        for (int d = 0; d < 16 && interior; d += 2) {
+            interior = is_water(v_uv + EDGE_DIRECTIONS[d] * radius);
+        }
     
-        for (float d = 0.0; d < TAU; d += TAU / DIRS) {
-            for(float i = inv_quality; i <= 1.0; i += inv_quality) {
-                if (texture(s_texture0, v_uv + vec2(cos(d), sin(d)) * radius * i).r == 0.0) final_col *= 5.0;
+        if (!interior) {
+            for (int d = 0; d < 16; d++) {
+                vec2 offset = EDGE_DIRECTIONS[d] * radius;
+                if (!is_water(v_uv + offset * (1.0 / 3.0))) final_col *= 5.0;
+                if (!is_water(v_uv + offset * (2.0 / 3.0))) final_col *= 5.0;
+                if (!is_water(v_uv + offset)) final_col *= 5.0;
             }
         }
 
@@ -309,6 +360,10 @@ void main() {
 """
         )
         self.water.shader["u_resolution"] = (self.engine.window_width, self.engine.window_height)
+        self.water.shader["s_texture0"] = 0
+        self.water.shader["s_texture1"] = 1
+        # Only uniform that changes every frame
+        self.water_time = self.water.shader["u_time"]
 
         self.blurwater = BasicScreenQuad(
             self.engine,
@@ -336,50 +391,92 @@ uniform vec2 u_resolution;
 uniform sampler2D s_texture0;
 uniform sampler2D s_texture1;
 
-#define TAU 6.28318530718
-#define DIRS 24.0   // Blur directions
-#define QUALITY 8.0 // Blur quality
+#define DIRS 24     // Blur directions
+#define QUALITY 8   // Blur quality
 #define SIZE 4.0    // Blur size
 
+#define THRESHOLD 0.2 // Fake metaball threshold
+
+// Unit vectors of the blur directions, TAU / DIRS apart
+const vec2 DIRECTIONS[24] = vec2[24](
+    vec2(1.000000, 0.000000),
+    vec2(0.965926, 0.258819),
+    vec2(0.866025, 0.500000),
+    vec2(0.707107, 0.707107),
+    vec2(0.500000, 0.866025),
+    vec2(0.258819, 0.965926),
+    vec2(0.000000, 1.000000),
+    vec2(-0.258819, 0.965926),
+    vec2(-0.500000, 0.866025),
+    vec2(-0.707107, 0.707107),
+    vec2(-0.866025, 0.500000),
+    vec2(-0.965926, 0.258819),
+    vec2(-1.000000, 0.000000),
+    vec2(-0.965926, -0.258819),
+    vec2(-0.866025, -0.500000),
+    vec2(-0.707107, -0.707107),
+    vec2(-0.500000, -0.866025),
+    vec2(-0.258819, -0.965926),
+    vec2(0.000000, -1.000000),
+    vec2(0.258819, -0.965926),
+    vec2(0.500000, -0.866025),
+    vec2(0.707107, -0.707107),
+    vec2(0.866025, -0.500000),
+    vec2(0.965926, -0.258819)
+);
+
 void main() {
     vec2 uv = v_uv;
 
-    if (texture(s_texture1, uv).r == 1.0) {
+    if (texture(s_texture1, uv).r > THRESHOLD) {
         vec2 radius = SIZE / u_resolution;
 
         vec4 color = texture(s_texture0, uv);
 
-        float inv_quality = 1.0 / QUALITY;
+        float inv_quality = 1.0 / float(QUALITY);
 
-        for (float d = 0.0; d < TAU; d += TAU / DIRS) {
-            for(float i = inv_quality; i <= 1.0; i += inv_quality) {
-                color += texture(s_texture0, uv + vec2(cos(d), sin(d)) * radius * i);
+        for (int d = 0; d < DIRS; d++) {
+            vec2 offset = DIRECTIONS[d] * radius;
+            for (int i = 1; i <= QUALITY; i++) {
+                color += texture(s_texture0, uv + offset * (float(i) * inv_quality));
             }
         }
 
-        color /= QUALITY * DIRS - 15.0;
-        out_color = color.bgra;
+        color /= float(QUALITY * DIRS) - 15.0;
+        out_color = color;
     }
 
     else {
-        out_color = texture(s_texture0, uv).bgra;
+        out_color = texture(s_texture0, uv);
     }
 }
 """
         )
         self.blurwater.shader["u_resolution"] = (self.engine.window_width, self.engine.window_height)
+        self.blurwater.shader["s_texture0"] = 0
+        self.blurwater.shader["s_texture1"] = 1
+
+        # Particles and their blur are low frequency, so the first two phases
+        # run at half resolution and are thresholded after linear upsampling.
+        # Blur radius is in UV space, u_resolution stays at window size.
+        # Both only hold the particle mask, so a single channel is enough;
+        # blending still uses the shader's output alpha, storing the same
+        # value an RGBA target would have in its alpha.
+        half_size = (self.engine.window_width // 2, self.engine.window_height // 2)
 
         self.first_fbo = self.engine.context.framebuffer(
-            color_attachments=self.engine.context.texture((self.engine.window_width, self.engine.window_height), 4)
+            color_attachments=self.engine.context.texture(half_size, 1)
         )
         self.first_fbo.color_attachments[0].repeat_x = False
         self.first_fbo.color_attachments[0].repeat_y = False
+        self.first_fbo.color_attachments[0].filter = (moderngl.LINEAR, moderngl.LINEAR)
 
         self.second_fbo = self.engine.context.framebuffer(
-            color_attachments=self.engine.context.texture((self.engine.window_width, self.engine.window_height), 4)
+            color_attachments=self.engine.context.texture(half_size, 1)
         )
         self.second_fbo.color_attachments[0].repeat_x = False
         self.second_fbo.color_attachments[0].repeat_y = False
+        self.second_fbo.color_attachments[0].filter = (moderngl.LINEAR, moderngl.LINEAR)
 
         self.third_fbo = self.engine.context.framebuffer(
             color_attachments=self.engine.context.texture((self.engine.window_width, self.engine.window_height), 4)
@@ -387,52 +484,69 @@ void main() {
         self.third_fbo.color_attachments[0].repeat_x = False
         self.third_fbo.color_attachments[0].repeat_y = False
 
-        self.fourth_fbo = self.engine.context.framebuffer(
-            color_attachments=self.engine.context.texture((self.engine.window_width, self.engine.window_height), 4)
-        )
-        self.fourth_fbo.color_attachments[0].repeat_x = False
-        self.fourth_fbo.color_attachments[0].repeat_y = False
+        self.time_start = perf_counter()
 
-        self.time_start = time()
+    def render_debug(self):
+        """ Draw particle outlines on the final FBO instead of water. """
+        self.engine.final_fbo.use()
+        self.debug_particle_vao.render(moderngl.TRIANGLE_STRIP, vertices=4, instances=len(self.scene.particles))
+
+    def render(self, bounds: tuple[float, float, float, float]):
+        """
+        Render water over the final FBO.
+
+        Parameters
+        ----------
+        @param bounds Particle bounding box as (min x, min y, max x, max y) in pixels
+        """
+
+        # Passes after the particle batch only shade the area water can reach,
+        # the rest of the final FBO keeps the display. Clears apply the
+        # framebuffer's scissor, so intermediate targets are cleared with an
+        # explicit full viewport and nothing from previous frames is sampled.
+        width = self.engine.window_width
+        height = self.engine.window_height
+        reach = self.water_reach
+        x0 = max(int(bounds[0] - reach), 0)
+        y0 = max(int(bounds[1] - reach), 0)
+        x1 = min(int(bounds[2] + reach) + 1, width)
+        y1 = min(int(bounds[3] + reach) + 1, height)
+
+        self.second_fbo.scissor = (x0 // 2, y0 // 2, (x1 + 1) // 2 - x0 // 2, (y1 + 1) // 2 - y0 // 2)
+        self.third_fbo.scissor = (x0, y0, x1 - x0, y1 - y0)
+        # Last phase flips Y
+        final_scissor = (x0, height - y1, x1 - x0, y1 - y0)
 
-    def render(self):
         # First phase (batch render bodies)
         self.first_fbo.use()
         self.engine.context.clear()
 
-        self.particle_vao.render(moderngl.POINTS, vertices=len(self.scene.particles))
+        self.particle_vao.render(moderngl.TRIANGLE_STRIP, vertices=4, instances=len(self.scene.particles))
 
         # Second phase (blur)
         self.second_fbo.use()
-        self.engine.context.clear()
+        self.engine.context.clear(viewport=(0, 0) + self.second_fbo.size)
 
         self.first_fbo.color_attachments[0].use()
         self.blur.vao.render()
 
-        # Third phase (fake metaballs by cutting off threshold)
+        # Third phase (water)
         self.third_fbo.use()
-        self.engine.context.clear()
-
-        self.second_fbo.color_attachments[0].use()
-        self.second_phase.vao.render()
-
-        # Fourth phase (water)
-        self.fourth_fbo.use()
-        self.engine.context.clear()
+        self.engine.context.clear(viewport=(0, 0) + self.third_fbo.size)
 
-        self.water.shader["s_texture0"] = 0
-        self.water.shader["s_texture1"] = 1
-        self.water.shader["u_time"] = time() - self.time_start
-        self.third_fbo.color_attachments[0].use(0)
+        self.water_time.value = perf_counter() - self.time_start
+        self.second_fbo.color_attachments[0].use(0)
         self.engine.display_tex.use(1)
         self.water.vao.render()
 
-        # Fifth phase (blur water)
+        # Fourth phase (blur water)
+        self.engine.final_fbo.scissor = final_scissor
         self.engine.final_fbo.use()
-        self.engine.context.clear()
+        self.engine.context.clear(viewport=final_scissor)
 
-        self.blurwater.shader["s_texture0"] = 0
-        self.blurwater.shader["s_texture1"] = 1
-        self.fourth_fbo.color_attachments[0].use(0)
-        self.third_fbo.color_attachments[0].use(1)
-        self.blurwater.vao.render()
\ No newline at end of file
+        self.third_fbo.color_attachments[0].use(0)
+        self.second_fbo.color_attachments[0].use(1)
+        self.blurwater.vao.render()
+
+        # Final FBO is used by the engine every frame
+        self.engine.final_fbo.scissor = None
\ No newline at end of file